@@ -1,67 +1,101 @@
 """ORE Cross Currency Swap Curve Bootstrapping."""
 
-from ore_xccy_curve.curve_builder import (
-    CalendarFactory,
-    DayCountFactory,
-    OISCurveBuilder,
-    OISIndexFactory,
-    XCCYCurveBuilder,
-    build_xccy_curve,
-)
-from ore_xccy_curve.curve_converters import (
-    create_flat_forward_curve,
-    get_discount_factors,
-    get_zero_rates,
-    ore_curve_to_quantlib,
-    ore_handle_to_curve,
-    quantlib_curve_to_ore_handle,
-    quantlib_curve_to_relinkable_handle,
-)
-from ore_xccy_curve.curve_loaders import (
-    load_curve_from_csv,
-    load_curve_from_json,
-)
-from ore_xccy_curve.curve_savers import (
-    extract_curve_points,
-    save_curve_to_csv,
-    save_curve_to_json,
-)
-from ore_xccy_curve.market_data import (
-    CurrencyConfig,
-    FXForwardQuote,
-    MarketDataFactory,
-    XCCYBasisSwapQuote,
-    XCCYMarketData,
-)
+import importlib
+from typing import TYPE_CHECKING
 
-__all__ = [
+if TYPE_CHECKING:
+    from ore_xccy_curve.curve_builder import (
+        CalendarFactory,
+        DayCountFactory,
+        OISCurveBuilder,
+        OISIndexFactory,
+        XCCYCurveBuilder,
+        build_xccy_curve,
+    )
+    from ore_xccy_curve.curve_converters import (
+        create_flat_forward_curve,
+        get_discount_factors,
+        get_discount_factors_array,
+        get_zero_rates,
+        get_zero_rates_array,
+        ore_curve_to_quantlib,
+        ore_handle_to_curve,
+        quantlib_curve_to_ore_handle,
+        quantlib_curve_to_relinkable_handle,
+    )
+    from ore_xccy_curve.curve_loaders import (
+        load_curve_from_csv,
+        load_curve_from_json,
+        load_curve_from_parquet,
+    )
+    from ore_xccy_curve.curve_savers import (
+        extract_curve_points,
+        save_curve_to_csv,
+        save_curve_to_json,
+        save_curve_to_parquet,
+        save_curves_to_csv,
+    )
+    from ore_xccy_curve.market_data import (
+        CurrencyConfig,
+        FXForwardQuote,
+        MarketDataFactory,
+        XCCYBasisSwapQuote,
+        XCCYMarketData,
+        XCCYMarketDataArrays,
+    )
+
+# Public symbols are resolved lazily (PEP 562) so that importing the package
+# does not pull in ORE until a symbol that needs it is first accessed.
+_LAZY_EXPORTS = {
     # Curve builders
-    "XCCYCurveBuilder",
-    "OISCurveBuilder",
-    "build_xccy_curve",
+    "XCCYCurveBuilder": "ore_xccy_curve.curve_builder",
+    "OISCurveBuilder": "ore_xccy_curve.curve_builder",
+    "build_xccy_curve": "ore_xccy_curve.curve_builder",
     # Market data
-    "XCCYMarketData",
-    "CurrencyConfig",
-    "FXForwardQuote",
-    "XCCYBasisSwapQuote",
-    "MarketDataFactory",
+    "XCCYMarketData": "ore_xccy_curve.market_data",
+    "XCCYMarketDataArrays": "ore_xccy_curve.market_data",
+    "CurrencyConfig": "ore_xccy_curve.market_data",
+    "FXForwardQuote": "ore_xccy_curve.market_data",
+    "XCCYBasisSwapQuote": "ore_xccy_curve.market_data",
+    "MarketDataFactory": "ore_xccy_curve.market_data",
     # Factories
-    "OISIndexFactory",
-    "CalendarFactory",
-    "DayCountFactory",
+    "OISIndexFactory": "ore_xccy_curve.curve_builder",
+    "CalendarFactory": "ore_xccy_curve.curve_builder",
+    "DayCountFactory": "ore_xccy_curve.curve_builder",
     # Converters
-    "quantlib_curve_to_ore_handle",
-    "quantlib_curve_to_relinkable_handle",
-    "ore_handle_to_curve",
-    "ore_curve_to_quantlib",
-    "create_flat_forward_curve",
-    "get_discount_factors",
-    "get_zero_rates",
+    "quantlib_curve_to_ore_handle": "ore_xccy_curve.curve_converters",
+    "quantlib_curve_to_relinkable_handle": "ore_xccy_curve.curve_converters",
+    "ore_handle_to_curve": "ore_xccy_curve.curve_converters",
+    "ore_curve_to_quantlib": "ore_xccy_curve.curve_converters",
+    "create_flat_forward_curve": "ore_xccy_curve.curve_converters",
+    "get_discount_factors": "ore_xccy_curve.curve_converters",
+    "get_discount_factors_array": "ore_xccy_curve.curve_converters",
+    "get_zero_rates": "ore_xccy_curve.curve_converters",
+    "get_zero_rates_array": "ore_xccy_curve.curve_converters",
     # Curve savers
-    "extract_curve_points",
-    "save_curve_to_csv",
-    "save_curve_to_json",
+    "extract_curve_points": "ore_xccy_curve.curve_savers",
+    "save_curve_to_csv": "ore_xccy_curve.curve_savers",
+    "save_curve_to_json": "ore_xccy_curve.curve_savers",
+    "save_curve_to_parquet": "ore_xccy_curve.curve_savers",
+    "save_curves_to_csv": "ore_xccy_curve.curve_savers",
     # Curve loaders
-    "load_curve_from_csv",
-    "load_curve_from_json",
-]
+    "load_curve_from_csv": "ore_xccy_curve.curve_loaders",
+    "load_curve_from_json": "ore_xccy_curve.curve_loaders",
+    "load_curve_from_parquet": "ore_xccy_curve.curve_loaders",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Import the submodule providing ``name`` on first access."""
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include lazily exported names in dir()."""
+    return sorted(list(globals()) + __all__)
@@ -9,11 +9,45 @@ Supports any currency pair configuration.
 """
 
 from datetime import date
-from typing import Callable, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, TextIO, Tuple
 
+import numpy as np
 import ORE as ore
 
-from ore_xccy_curve.market_data import CurrencyConfig, XCCYMarketData
+from ore_xccy_curve.curve_converters import (
+    _ACTUAL_FIXED_DAYS,
+    _SERIAL_EPOCH,
+    _log_linear_discounts,
+    get_discount_factors_array,
+)
+from ore_xccy_curve.market_data import CurrencyConfig, XCCYMarketData, _parse_tenor
+
+
+@lru_cache(maxsize=4096)
+def _to_ore_date(d: date) -> ore.Date:
+    """Convert a Python date to ORE Date (memoized; ore.Date is immutable)."""
+    return ore.Date(d.day, d.month, d.year)
+
+
+def _set_evaluation_date(eval_date: ore.Date) -> None:
+    """Set the global evaluation date only if it differs, avoiding observer notifications."""
+    settings = ore.Settings.instance()
+    if settings.evaluationDate != eval_date:
+        settings.evaluationDate = eval_date
+
+
+# Tenors reported by XCCYCurveBuilder.print_curve_summary
+_SUMMARY_TENORS = ("1M", "3M", "6M", "1Y", "2Y", "3Y", "5Y", "7Y", "10Y", "20Y", "30Y")
+
+_TENOR_UNITS = {"W": ore.Weeks, "M": ore.Months, "Y": ore.Years}
+
+
+@lru_cache(maxsize=None)
+def _tenor_to_period(tenor: str) -> ore.Period:
+    """Convert tenor string to ORE Period (memoized per tenor string)."""
+    count, unit = _parse_tenor(tenor)
+    return ore.Period(count, _TENOR_UNITS[unit])
 
 
 class OISIndexFactory:
@@ -29,24 +63,35 @@ class OISIndexFactory:
         "CORRA": lambda handle: ore.Corra(handle) if handle else ore.Corra(),
     }
 
+    # Handle-less indices keyed by name. Indices built on a caller's curve
+    # are not cached, so the cache never keeps those curves alive.
+    _CACHE: Dict[str, ore.OvernightIndex] = {}
+
     @classmethod
     def create(
         cls,
         index_name: str,
         curve_handle: Optional[ore.YieldTermStructureHandle] = None,
     ) -> ore.OvernightIndex:
-        """Create an OIS index by name."""
+        """Create an OIS index by name, reusing the handle-less one."""
         if index_name not in cls._INDEX_REGISTRY:
             raise ValueError(
                 f"Unknown OIS index: {index_name}. "
                 f"Available: {list(cls._INDEX_REGISTRY.keys())}"
             )
-        return cls._INDEX_REGISTRY[index_name](curve_handle)
+        if curve_handle is not None:
+            return cls._INDEX_REGISTRY[index_name](curve_handle)
+        index = cls._CACHE.get(index_name)
+        if index is None:
+            index = cls._INDEX_REGISTRY[index_name](None)
+            cls._CACHE[index_name] = index
+        return index
 
     @classmethod
     def register(cls, name: str, constructor: Callable) -> None:
         """Register a new OIS index constructor."""
         cls._INDEX_REGISTRY[name] = constructor
+        cls._CACHE.pop(name, None)
 
 
 class CalendarFactory:
@@ -63,20 +108,43 @@ class CalendarFactory:
         "Canada": lambda: ore.Canada(),
     }
 
+    # Created calendars keyed by name, and joint calendars by name pair
+    _CACHE: Dict[str, ore.Calendar] = {}
+    _JOINT_CACHE: Dict[Tuple[str, str], ore.Calendar] = {}
+
     @classmethod
     def create(cls, calendar_name: str) -> ore.Calendar:
-        """Create a calendar by name."""
+        """Create a calendar by name, reusing one instance per name."""
+        calendar = cls._CACHE.get(calendar_name)
+        if calendar is not None:
+            return calendar
         if calendar_name not in cls._CALENDAR_REGISTRY:
             raise ValueError(
                 f"Unknown calendar: {calendar_name}. "
                 f"Available: {list(cls._CALENDAR_REGISTRY.keys())}"
             )
-        return cls._CALENDAR_REGISTRY[calendar_name]()
+        calendar = cls._CALENDAR_REGISTRY[calendar_name]()
+        cls._CACHE[calendar_name] = calendar
+        return calendar
+
+    @classmethod
+    def create_joint(cls, first_name: str, second_name: str) -> ore.Calendar:
+        """Create the joint calendar of two named calendars, reusing instances."""
+        key = (first_name, second_name)
+        calendar = cls._JOINT_CACHE.get(key)
+        if calendar is None:
+            calendar = ore.JointCalendar(
+                cls.create(first_name), cls.create(second_name)
+            )
+            cls._JOINT_CACHE[key] = calendar
+        return calendar
 
     @classmethod
     def register(cls, name: str, constructor: Callable[[], ore.Calendar]) -> None:
         """Register a new calendar constructor."""
         cls._CALENDAR_REGISTRY[name] = constructor
+        cls._CACHE.pop(name, None)
+        cls._JOINT_CACHE = {k: v for k, v in cls._JOINT_CACHE.items() if name not in k}
 
 
 class DayCountFactory:
@@ -90,15 +158,23 @@ class DayCountFactory:
         "Thirty360": lambda: ore.Thirty360(ore.Thirty360.BondBasis),
     }
 
+    # Created day counters keyed by name
+    _CACHE: Dict[str, ore.DayCounter] = {}
+
     @classmethod
     def create(cls, day_count_name: str) -> ore.DayCounter:
-        """Create a day count convention by name."""
+        """Create a day count convention by name, reusing one instance per name."""
+        day_count = cls._CACHE.get(day_count_name)
+        if day_count is not None:
+            return day_count
         if day_count_name not in cls._DAYCOUNT_REGISTRY:
             raise ValueError(
                 f"Unknown day count: {day_count_name}. "
                 f"Available: {list(cls._DAYCOUNT_REGISTRY.keys())}"
             )
-        return cls._DAYCOUNT_REGISTRY[day_count_name]()
+        day_count = cls._DAYCOUNT_REGISTRY[day_count_name]()
+        cls._CACHE[day_count_name] = day_count
+        return day_count
 
 
 class OISCurveBuilder:
@@ -108,6 +184,15 @@ class OISCurveBuilder:
     This is a helper class for building single-currency discount curves.
     """
 
+    __slots__ = (
+        "eval_date",
+        "ccy_config",
+        "ois_rates",
+        "settlement_days",
+        "calendar",
+        "day_count",
+    )
+
     def __init__(
         self,
         eval_date: ore.Date,
@@ -132,18 +217,6 @@ class OISCurveBuilder:
         self.calendar = CalendarFactory.create(ccy_config.calendar_name)
         self.day_count = DayCountFactory.create(ccy_config.day_count)
 
-    @staticmethod
-    def _tenor_to_period(tenor: str) -> ore.Period:
-        """Convert tenor string to ORE Period."""
-        if tenor.endswith("W"):
-            return ore.Period(int(tenor[:-1]), ore.Weeks)
-        elif tenor.endswith("M"):
-            return ore.Period(int(tenor[:-1]), ore.Months)
-        elif tenor.endswith("Y"):
-            return ore.Period(int(tenor[:-1]), ore.Years)
-        else:
-            raise ValueError(f"Unknown tenor format: {tenor}")
-
     def build(self) -> ore.YieldTermStructureHandle:
         """
         Build the OIS discount curve.
@@ -156,7 +229,7 @@ class OISCurveBuilder:
 
         for tenor, rate in self.ois_rates:
             quote = ore.QuoteHandle(ore.SimpleQuote(rate))
-            period = self._tenor_to_period(tenor)
+            period = _tenor_to_period(tenor)
             helper = ore.OISRateHelper(self.settlement_days, period, quote, index)
             helpers.append(helper)
 
@@ -182,6 +255,25 @@ class XCCYCurveBuilder:
     by cross-currency basis swaps).
     """
 
+    __slots__ = (
+        "market_data",
+        "domestic_discount_curve",
+        "domestic_index_curve",
+        "foreign_index_curve",
+        "foreign_xccy_curve",
+        "fx_spot_handle",
+        "_fwd_quotes",
+        "_basis_quotes",
+        "_helpers",
+        "_curve",
+        "domestic_calendar",
+        "foreign_calendar",
+        "joint_calendar",
+        "foreign_day_count",
+        "settlement_days",
+        "eval_date",
+    )
+
     def __init__(
         self,
         market_data: XCCYMarketData,
@@ -209,6 +301,13 @@ class XCCYCurveBuilder:
         self.foreign_xccy_curve: Optional[ore.YieldTermStructureHandle] = None
         self.fx_spot_handle: Optional[ore.QuoteHandle] = None
 
+        # Helper quotes (populated after build()); setValue() on these
+        # re-triggers the bootstrap without rebuilding the helpers
+        self._fwd_quotes: List[ore.SimpleQuote] = []
+        self._basis_quotes: List[ore.SimpleQuote] = []
+        self._helpers: list = []
+        self._curve: Optional[ore.PiecewiseLogLinearDiscount] = None
+
     def _setup_conventions(self) -> None:
         """Set up calendars and market conventions."""
         self.domestic_calendar = CalendarFactory.create(
@@ -217,8 +316,9 @@ class XCCYCurveBuilder:
         self.foreign_calendar = CalendarFactory.create(
             self.market_data.foreign_ccy.calendar_name
         )
-        self.joint_calendar = ore.JointCalendar(
-            self.domestic_calendar, self.foreign_calendar
+        self.joint_calendar = CalendarFactory.create_joint(
+            self.market_data.domestic_ccy.calendar_name,
+            self.market_data.foreign_ccy.calendar_name,
         )
         self.foreign_day_count = DayCountFactory.create(
             self.market_data.foreign_ccy.day_count
@@ -226,20 +326,8 @@ class XCCYCurveBuilder:
         self.settlement_days = 2
 
         val_date = self.market_data.valuation_date
-        self.eval_date = ore.Date(val_date.day, val_date.month, val_date.year)
-        ore.Settings.instance().evaluationDate = self.eval_date
-
-    @staticmethod
-    def _tenor_to_period(tenor: str) -> ore.Period:
-        """Convert tenor string to ORE Period."""
-        if tenor.endswith("W"):
-            return ore.Period(int(tenor[:-1]), ore.Weeks)
-        elif tenor.endswith("M"):
-            return ore.Period(int(tenor[:-1]), ore.Months)
-        elif tenor.endswith("Y"):
-            return ore.Period(int(tenor[:-1]), ore.Years)
-        else:
-            raise ValueError(f"Unknown tenor format: {tenor}")
+        self.eval_date = _to_ore_date(val_date)
+        _set_evaluation_date(self.eval_date)
 
     @property
     def ccy_pair(self) -> str:
@@ -278,24 +366,38 @@ class XCCYCurveBuilder:
         # For USDJPY: fx_base=USD, domestic=USD → True
         is_fx_base_collateral = self.market_data.is_fx_base_domestic
 
+        # Bind loop invariants to locals once for both helper loops
+        settlement_days = self.settlement_days
+        joint_calendar = self.joint_calendar
+        modified_following = ore.ModifiedFollowing
+        domestic_discount_curve = self.domestic_discount_curve
+        domestic_index_curve = self.domestic_index_curve
+        foreign_index_curve = self.foreign_index_curve
+        quote_handle = ore.QuoteHandle
+        append = helpers.append
+
+        fx_forwards = self.market_data.fx_forwards
+        self._fwd_quotes = [
+            ore.SimpleQuote(fwd.forward_points / 10000.0) for fwd in fx_forwards
+        ]
+
         # Add FX forward helpers for short end
-        for fwd in self.market_data.fx_forwards:
-            fwd_points = fwd.forward_points / 10000.0
-            fwd_points_quote = ore.QuoteHandle(ore.SimpleQuote(fwd_points))
-            period = self._tenor_to_period(fwd.tenor)
+        fx_swap_helper = ore.FxSwapRateHelper
+        for fwd, fwd_quote in zip(fx_forwards, self._fwd_quotes):
+            period = _tenor_to_period(fwd.tenor)
 
-            helper = ore.FxSwapRateHelper(
-                fwd_points_quote,
+            helper = fx_swap_helper(
+                quote_handle(fwd_quote),
                 fx_spot_quote,
                 period,
-                self.settlement_days,
-                self.joint_calendar,
-                ore.ModifiedFollowing,
+                settlement_days,
+                joint_calendar,
+                modified_following,
                 True,  # end of month
                 is_fx_base_collateral,  # isFxBaseCurrencyCollateralCurrency
-                self.domestic_discount_curve,
+                domestic_discount_curve,
             )
-            helpers.append(helper)
+            append(helper)
 
         # Add cross-currency basis swap helpers for long end
         # Use mark-to-market reset helpers (market standard for XCCY basis swaps)
@@ -308,39 +410,44 @@ class XCCYCurveBuilder:
         # A negative basis (e.g., -12.5 bps) means foreign pays OIS - 12.5 bps.
         domestic_index = OISIndexFactory.create(
             self.market_data.domestic_ccy.ois_index_name,
-            self.domestic_index_curve,
+            domestic_index_curve,
         )
         foreign_index = OISIndexFactory.create(
             self.market_data.foreign_ccy.ois_index_name,
-            self.foreign_index_curve,
+            foreign_index_curve,
         )
 
-        for swap in self.market_data.xccy_basis_swaps:
-            spread = swap.basis_spread / 10000.0
-            spread_quote = ore.QuoteHandle(ore.SimpleQuote(spread))
-            period = self._tenor_to_period(swap.tenor)
+        basis_swaps = self.market_data.xccy_basis_swaps
+        self._basis_quotes = [
+            ore.SimpleQuote(swap.basis_spread / 10000.0) for swap in basis_swaps
+        ]
+
+        basis_swap_helper = ore.CrossCcyBasisMtMResetSwapHelper
+        for swap, basis_quote in zip(basis_swaps, self._basis_quotes):
+            spread_quote = quote_handle(basis_quote)
+            period = _tenor_to_period(swap.tenor)
 
             # Use MtM reset helper - market standard for XCCY basis swaps
             # Parameter order: foreign first, domestic second (per ORE API)
-            helper = ore.CrossCcyBasisMtMResetSwapHelper(
+            helper = basis_swap_helper(
                 spread_quote,                    # spreadQuote: basis spread (on foreign leg)
                 fx_spot_quote,                   # spotFX: FX spot rate
-                self.settlement_days,            # settlementDays
-                self.joint_calendar,             # settlementCalendar
+                settlement_days,                 # settlementDays
+                joint_calendar,                  # settlementCalendar
                 period,                          # swapTenor
-                ore.ModifiedFollowing,           # rollConvention
+                modified_following,              # rollConvention
                 foreign_index,                   # foreignCcyIndex (foreign, FIXED notional)
                 domestic_index,                  # domesticCcyIndex (USD, notional RESETS)
                 xccy_curve_handle,               # foreignCcyDiscountCurve (being bootstrapped)
-                self.domestic_discount_curve,    # domesticCcyDiscountCurve (USD discount)
+                domestic_discount_curve,         # domesticCcyDiscountCurve (USD discount)
                 True,                            # foreignIndexGiven
                 True,                            # domesticIndexGiven
                 False,                           # foreignDiscountCurveGiven (bootstrapping this)
                 True,                            # domesticDiscountCurveGiven
-                self.foreign_index_curve,        # foreignCcyFxFwdRateCurve
-                self.domestic_index_curve,       # domesticCcyFxFwdRateCurve
+                foreign_index_curve,             # foreignCcyFxFwdRateCurve
+                domestic_index_curve,            # domesticCcyFxFwdRateCurve
             )
-            helpers.append(helper)
+            append(helper)
 
         # Bootstrap the curve
         curve = ore.PiecewiseLogLinearDiscount(
@@ -351,14 +458,53 @@ class XCCYCurveBuilder:
         curve.enableExtrapolation()
         xccy_curve_handle.linkTo(curve)
 
+        self._helpers = helpers
+        self._curve = curve
         self.foreign_xccy_curve = ore.YieldTermStructureHandle(curve)
         return self.foreign_xccy_curve
 
+    def rebuild(
+        self,
+        new_fwds: Optional[List[float]] = None,
+        new_spreads: Optional[List[float]] = None,
+    ) -> ore.YieldTermStructureHandle:
+        """
+        Re-bootstrap the built curve with bumped quotes.
+
+        Updates the quotes created by build() in place; the existing helpers
+        and curve are reused and the curve recalculates lazily on next query.
+        The market data object is left unchanged.
+
+        Args:
+            new_fwds: Forward points (in pips), one per FX forward quote
+            new_spreads: Basis spreads (in bps), one per basis swap quote
+
+        Returns:
+            Handle to the foreign cross-currency basis curve
+        """
+        if self._curve is None:
+            raise ValueError("XCCY curve not built. Call build() first.")
+
+        for values, quotes, label in (
+            (new_fwds, self._fwd_quotes, "forward points"),
+            (new_spreads, self._basis_quotes, "basis spreads"),
+        ):
+            if values is None:
+                continue
+            if len(values) != len(quotes):
+                raise ValueError(
+                    f"Expected {len(quotes)} {label}, got {len(values)}"
+                )
+            for quote, value in zip(quotes, values):
+                quote.setValue(value / 10000.0)
+
+        return self.foreign_xccy_curve
+
     def get_discount_factor(self, target_date: date) -> float:
         """Get discount factor from the XCCY curve."""
         if self.foreign_xccy_curve is None:
             raise ValueError("XCCY curve not built. Call build() first.")
-        ore_date = ore.Date(target_date.day, target_date.month, target_date.year)
+        ore_date = _to_ore_date(target_date)
         return self.foreign_xccy_curve.discount(ore_date)
 
     def get_zero_rate(
@@ -367,12 +513,68 @@ class XCCYCurveBuilder:
         """Get zero rate from the XCCY curve."""
         if self.foreign_xccy_curve is None:
             raise ValueError("XCCY curve not built. Call build() first.")
-        ore_date = ore.Date(target_date.day, target_date.month, target_date.year)
+        ore_date = _to_ore_date(target_date)
         comp = ore.Continuous if compounding == "continuous" else ore.Annual
         return self.foreign_xccy_curve.zeroRate(
             ore_date, self.foreign_day_count, comp
         ).rate()
 
+    def get_zero_rates(
+        self, target_dates: List[date], compounding: str = "continuous"
+    ) -> np.ndarray:
+        """
+        Get zero rates from the XCCY curve for many dates at once.
+
+        Vectorized form of get_zero_rate: discount factors come from
+        discounts_batch and are converted to rates in NumPy. Dates on the
+        reference date, or curves on other day counts, use zeroRate().
+        """
+        if self.foreign_xccy_curve is None:
+            raise ValueError("XCCY curve not built. Call build() first.")
+
+        days = _ACTUAL_FIXED_DAYS.get(self.foreign_day_count.name())
+        if days is None:
+            return np.array([self.get_zero_rate(d, compounding) for d in target_dates])
+
+        dfs = self.discounts_batch(target_dates)
+        serials = (
+            np.array(target_dates, dtype="datetime64[D]") - _SERIAL_EPOCH
+        ).astype(np.float64)
+        t = (serials - self.foreign_xccy_curve.referenceDate().serialNumber()) / days
+
+        positive = t > 0
+        safe_t = np.where(positive, t, 1.0)
+        if compounding == "continuous":
+            rates = -np.log(dfs) / safe_t
+        else:
+            rates = dfs ** (-1.0 / safe_t) - 1.0
+        for i in np.flatnonzero(~positive):
+            rates[i] = self.get_zero_rate(target_dates[i], compounding)
+        return rates
+
+    def discounts_batch(self, target_dates: List[date]) -> np.ndarray:
+        """
+        Get discount factors from the XCCY curve for many dates at once.
+
+        Dates are converted to serial numbers in NumPy and the curve's
+        log-linear nodes are interpolated for all of them together, rather
+        than calling discount() once per date.
+        """
+        if self._curve is None:
+            raise ValueError("XCCY curve not built. Call build() first.")
+        if not target_dates:
+            return np.empty(0, dtype=np.float64)
+
+        serials = (
+            np.array(target_dates, dtype="datetime64[D]") - _SERIAL_EPOCH
+        ).astype(np.float64)
+        dfs = _log_linear_discounts(self._curve, serials)
+        if dfs is None:
+            dfs = get_discount_factors_array(
+                self.foreign_xccy_curve, [_to_ore_date(d) for d in target_dates]
+            )
+        return dfs
+
     def get_implied_fx_forward(self, target_date: date) -> float:
         """
         Calculate implied FX forward rate from the curves.
@@ -383,57 +585,89 @@ class XCCYCurveBuilder:
         if self.foreign_xccy_curve is None:
             raise ValueError("XCCY curve not built. Call build() first.")
 
-        ore_date = ore.Date(target_date.day, target_date.month, target_date.year)
+        ore_date = _to_ore_date(target_date)
         df_domestic = self.domestic_discount_curve.discount(ore_date)
         df_foreign = self.foreign_xccy_curve.discount(ore_date)
 
         return self.market_data.fx_spot * (df_domestic / df_foreign)
 
-    def print_curve_summary(self) -> None:
-        """Print a summary of the bootstrapped XCCY curve."""
+    def get_implied_fx_forwards(self, target_dates: List[date]) -> np.ndarray:
+        """
+        Calculate implied FX forward rates for many dates at once.
+
+        Vectorized form of get_implied_fx_forward: both curves are sampled
+        in one batch each and F = S * (DF_domestic / DF_foreign_xccy) is
+        evaluated over the whole array.
+        """
         if self.foreign_xccy_curve is None:
-            print("XCCY curve not built. Call build() first.")
+            raise ValueError("XCCY curve not built. Call build() first.")
+
+        ore_dates = [_to_ore_date(d) for d in target_dates]
+        df_domestic = get_discount_factors_array(self.domestic_discount_curve, ore_dates)
+        df_foreign = self.discounts_batch(target_dates)
+
+        return self.market_data.fx_spot * (df_domestic / df_foreign)
+
+    def print_curve_summary(self, file: Optional[TextIO] = None) -> None:
+        """
+        Print a summary of the bootstrapped XCCY curve.
+
+        Args:
+            file: Stream to write to (defaults to sys.stdout)
+        """
+        if self.foreign_xccy_curve is None:
+            print("XCCY curve not built. Call build() first.", file=file)
             return
 
-        print(f"\n{'='*70}")
-        print(f"{self.ccy_pair} XCCY Basis Curve Summary")
-        print(f"{'='*70}")
-        print(f"Valuation Date: {self.market_data.valuation_date}")
-        print(f"FX Spot: {self.market_data.fx_spot:.4f}")
-        print(f"Domestic: {self.domestic_ccy} ({self.market_data.domestic_ccy.ois_index_name})")
-        print(f"Foreign: {self.foreign_ccy} ({self.market_data.foreign_ccy.ois_index_name})")
-
-        tenors = ["1M", "3M", "6M", "1Y", "2Y", "3Y", "5Y", "7Y", "10Y", "20Y", "30Y"]
-
-        print(f"\n{'Tenor':<8} {self.domestic_ccy + ' DF':<12} {self.foreign_ccy + ' DF':<12} "
-              f"{'XCCY DF':<12} {'FX Fwd':<12} {'Basis (bps)':<12}")
-        print("-" * 70)
-
-        for tenor in tenors:
-            period = self._tenor_to_period(tenor)
-            target_date = self.joint_calendar.advance(self.eval_date, period)
-
-            df_domestic = self.domestic_discount_curve.discount(target_date)
-            df_foreign_idx = self.foreign_index_curve.discount(target_date)
-            df_xccy = self.foreign_xccy_curve.discount(target_date)
-
-            fx_fwd = self.market_data.fx_spot * (df_domestic / df_xccy)
-
-            # Implied basis = difference between XCCY curve and foreign index curve
-            year_frac = self.foreign_day_count.yearFraction(self.eval_date, target_date)
-            if year_frac > 0:
-                foreign_zero = -1.0 / year_frac * (df_foreign_idx - 1.0) if df_foreign_idx < 1 else 0
-                xccy_zero = -1.0 / year_frac * (df_xccy - 1.0) if df_xccy < 1 else 0
-                implied_basis = (xccy_zero - foreign_zero) * 10000
-            else:
-                implied_basis = 0.0
-
-            print(
-                f"{tenor:<8} {df_domestic:<12.6f} {df_foreign_idx:<12.6f} {df_xccy:<12.6f} "
-                f"{fx_fwd:<12.4f} {implied_basis:<12.1f}"
+        # Advance all summary dates first, then sample each curve in one batch
+        advance = self.joint_calendar.advance
+        eval_date = self.eval_date
+        target_dates = [
+            advance(eval_date, _tenor_to_period(tenor)) for tenor in _SUMMARY_TENORS
+        ]
+
+        df_domestic = get_discount_factors_array(self.domestic_discount_curve, target_dates)
+        df_foreign_idx = get_discount_factors_array(self.foreign_index_curve, target_dates)
+        df_xccy = get_discount_factors_array(self.foreign_xccy_curve, target_dates)
+
+        fx_fwd = self.market_data.fx_spot * (df_domestic / df_xccy)
+
+        # Implied basis = difference between XCCY curve and foreign index curve
+        year_fraction = self.foreign_day_count.yearFraction
+        year_frac = np.array([year_fraction(eval_date, d) for d in target_dates])
+        positive = year_frac > 0
+        safe_frac = np.where(positive, year_frac, 1.0)
+        foreign_zero = np.where(df_foreign_idx < 1, (1.0 - df_foreign_idx) / safe_frac, 0.0)
+        xccy_zero = np.where(df_xccy < 1, (1.0 - df_xccy) / safe_frac, 0.0)
+        implied_basis = np.where(positive, (xccy_zero - foreign_zero) * 10000, 0.0)
+
+        rows = [
+            f"\n{'='*70}",
+            f"{self.ccy_pair} XCCY Basis Curve Summary",
+            f"{'='*70}",
+            f"Valuation Date: {self.market_data.valuation_date}",
+            f"FX Spot: {self.market_data.fx_spot:.4f}",
+            f"Domestic: {self.domestic_ccy} ({self.market_data.domestic_ccy.ois_index_name})",
+            f"Foreign: {self.foreign_ccy} ({self.market_data.foreign_ccy.ois_index_name})",
+            f"\n{'Tenor':<8} {self.domestic_ccy + ' DF':<12} {self.foreign_ccy + ' DF':<12} "
+            f"{'XCCY DF':<12} {'FX Fwd':<12} {'Basis (bps)':<12}",
+            "-" * 70,
+        ]
+        rows.extend(
+            f"{tenor:<8} {dd:<12.6f} {dfi:<12.6f} {dx:<12.6f} {fx:<12.4f} {ib:<12.1f}"
+            for tenor, dd, dfi, dx, fx, ib in zip(
+                _SUMMARY_TENORS,
+                df_domestic.tolist(),
+                df_foreign_idx.tolist(),
+                df_xccy.tolist(),
+                fx_fwd.tolist(),
+                implied_basis.tolist(),
             )
+        )
+        rows.append("")
 
-        print()
+        # One write for the whole block
+        print("\n".join(rows), file=file)
 
 
 def build_xccy_curve(
@@ -464,8 +698,8 @@ def build_xccy_curve(
         - "xccy_builder": The XCCYCurveBuilder instance
     """
     val_date = market_data.valuation_date
-    eval_date = ore.Date(val_date.day, val_date.month, val_date.year)
-    ore.Settings.instance().evaluationDate = eval_date
+    eval_date = _to_ore_date(val_date)
+    _set_evaluation_date(eval_date)
 
     # Build XCCY basis curve
     xccy_builder = XCCYCurveBuilder(
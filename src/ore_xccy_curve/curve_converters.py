@@ -5,8 +5,9 @@ ORE is built on QuantLib, so QuantLib YieldTermStructure objects can be
 wrapped in ORE handles for use with XCCYCurveBuilder, and vice versa.
 """
 
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Tuple, Union
 
+import numpy as np
 import ORE as ore
 
 if TYPE_CHECKING:
@@ -69,6 +70,30 @@ def quantlib_curve_to_relinkable_handle(
     return handle
 
 
+# Curve types interpolating log-linearly on discount factors, and the
+# day-count denominators for which times follow directly from date serials
+_LOG_LINEAR_DISCOUNT_CURVES = (ore.DiscountCurve, ore.PiecewiseLogLinearDiscount)
+_ACTUAL_FIXED_DAYS = {"Actual/365 (Fixed)": 365.0, "Actual/360": 360.0}
+
+
+class _FlatForwardHandle(ore.YieldTermStructureHandle):
+    """
+    Handle to a flat forward curve that records its closed-form parameters.
+
+    flat_params is (reference date serial, rate, day-count denominator) on
+    actual/fixed day counts, letting batch queries compute exp(-r * t)
+    directly, and None on other day counts.
+    """
+
+    def __init__(
+        self,
+        curve: ore.FlatForward,
+        flat_params: Union[Tuple[int, float, float], None],
+    ):
+        super().__init__(curve)
+        self.flat_params = flat_params
+
+
 def create_flat_forward_curve(
     valuation_date: ore.Date,
     rate: float,
@@ -77,6 +102,9 @@ def create_flat_forward_curve(
     """
     Create a simple flat forward curve for testing or placeholder purposes.
 
+    Every call returns a new curve, so enabling or disabling extrapolation
+    on one does not affect curves returned by other calls.
+
     Args:
         valuation_date: The curve's reference date
         rate: The flat forward rate (e.g., 0.05 for 5%)
@@ -94,7 +122,15 @@ def create_flat_forward_curve(
 
     flat_curve = ore.FlatForward(valuation_date, rate, day_count)
     flat_curve.enableExtrapolation()
-    return ore.YieldTermStructureHandle(flat_curve)
+    days = _ACTUAL_FIXED_DAYS.get(day_count.name())
+    flat_params = None if days is None else (valuation_date.serialNumber(), rate, days)
+    return _FlatForwardHandle(flat_curve, flat_params)
+
+
+# Whether this ORE build wraps Handle::empty(); resolved once at import
+_HANDLE_HAS_EMPTY = hasattr(ore.YieldTermStructureHandle, "empty") and hasattr(
+    ore.RelinkableYieldTermStructureHandle, "empty"
+)
 
 
 def ore_handle_to_curve(
@@ -123,6 +159,12 @@ def ore_handle_to_curve(
         >>> # Use with QuantLib APIs
         >>> df = curve.discount(target_date)
     """
+    # Cheap explicit check where the SWIG build exposes Handle::empty()
+    if _HANDLE_HAS_EMPTY:
+        if handle.empty():
+            raise ValueError("Handle is empty - not linked to any curve")
+        return handle.currentLink()
+
     try:
         # Try to access the curve - will raise if empty
         curve = handle.currentLink()
@@ -145,7 +187,9 @@ def ore_curve_to_quantlib(
     use in QuantLib-typed code.
 
     Note: This is essentially a no-op at runtime since ORE curves inherit
-    from QuantLib. It's provided for type clarity and documentation.
+    from QuantLib. It's provided for type clarity and documentation; in hot
+    pricing loops use the ORE curve directly (or ``typing.cast``) rather
+    than paying a function call per access.
 
     Args:
         ore_curve: An ORE YieldTermStructure
@@ -167,24 +211,26 @@ def ore_curve_to_quantlib(
 def get_discount_factors(
     handle: ore.YieldTermStructureHandle,
     dates: list,
-) -> list:
+) -> np.ndarray:
     """
     Extract discount factors from a curve for a list of dates.
 
-    Convenience function to get DFs for multiple dates at once.
+    Convenience function to get DFs for multiple dates at once. Same as
+    get_discount_factors_array, which it calls.
 
     Args:
         handle: An ORE YieldTermStructureHandle
         dates: List of ore.Date objects
 
     Returns:
-        List of discount factors corresponding to each date
+        float64 NumPy array of discount factors corresponding to each date.
+        Earlier versions returned a list; use ``.tolist()`` where one is needed.
 
     Example:
         >>> dates = [eval_date + ore.Period(t, ore.Years) for t in [1, 2, 5, 10]]
         >>> dfs = get_discount_factors(xccy_handle, dates)
     """
-    return [handle.discount(d) for d in dates]
+    return get_discount_factors_array(handle, dates)
 
 
 def get_zero_rates(
@@ -192,11 +238,12 @@ def get_zero_rates(
     dates: list,
     day_count: ore.DayCounter = None,
     compounding: int = None,
-) -> list:
+) -> np.ndarray:
     """
     Extract zero rates from a curve for a list of dates.
 
-    Convenience function to get zero rates for multiple dates at once.
+    Convenience function to get zero rates for multiple dates at once. Same
+    as get_zero_rates_array, which it calls.
 
     Args:
         handle: An ORE YieldTermStructureHandle
@@ -205,15 +252,142 @@ def get_zero_rates(
         compounding: Compounding convention (defaults to Continuous)
 
     Returns:
-        List of zero rates corresponding to each date
+        float64 NumPy array of zero rates corresponding to each date.
+        Earlier versions returned a list; use ``.tolist()`` where one is needed.
 
     Example:
         >>> dates = [eval_date + ore.Period(t, ore.Years) for t in [1, 2, 5, 10]]
         >>> rates = get_zero_rates(xccy_handle, dates)
     """
+    return get_zero_rates_array(handle, dates, day_count, compounding)
+
+
+# QuantLib date serial numbers count days from this epoch
+_SERIAL_EPOCH = np.datetime64("1899-12-30", "D")
+
+
+def _date_serials(dates: list) -> np.ndarray:
+    """Return the serial numbers of a list of ore.Date objects as float64."""
+    return np.fromiter(
+        (d.serialNumber() for d in dates), dtype=np.float64, count=len(dates)
+    )
+
+
+def _log_linear_discounts(curve, serials: np.ndarray) -> Union[np.ndarray, None]:
+    """
+    Interpolate discount factors from a log-linear curve's nodes in NumPy.
+
+    Reads the curve's nodes on every call, so quote changes that trigger a
+    re-bootstrap are picked up. Returns None when the curve or dates fall
+    outside what the vectorized path reproduces exactly, so the caller can
+    fall back to the curve.
+
+    Args:
+        curve: An ore.DiscountCurve or ore.PiecewiseLogLinearDiscount
+        serials: Date serial numbers to evaluate
+    """
+    days = _ACTUAL_FIXED_DAYS.get(curve.dayCounter().name())
+    if days is None:
+        return None
+
+    ref_serial = curve.referenceDate().serialNumber()
+    t = (serials - ref_serial) / days
+    node_times = np.asarray(curve.times(), dtype=np.float64)
+    log_dfs = np.log(np.asarray(curve.data(), dtype=np.float64))
+
+    t_max = node_times[-1]
+    beyond = t > t_max
+    if (t < 0.0).any() or (beyond.any() and not curve.allowsExtrapolation()):
+        return None
+
+    log_df = np.interp(t, node_times, log_dfs)
+    if beyond.any():
+        # QuantLib extrapolates with the last segment's forward rate
+        slope = (log_dfs[-1] - log_dfs[-2]) / (t_max - node_times[-2])
+        log_df[beyond] = log_dfs[-1] + slope * (t[beyond] - t_max)
+    return np.exp(log_df)
+
+
+def get_discount_factors_array(
+    handle: Union[ore.YieldTermStructureHandle, ore.YieldTermStructure],
+    dates: list,
+) -> np.ndarray:
+    """
+    Extract discount factors from a curve for a list of dates as a NumPy array.
+
+    Batch variant of get_discount_factors for curve-sampling-heavy paths.
+    The bound discount method is looked up once and the results are
+    written straight into a float64 array.
+
+    When given a concrete log-linear discount curve (ore.DiscountCurve or
+    ore.PiecewiseLogLinearDiscount) on an Actual/365 (Fixed) or Actual/360
+    day count, the nodes are read once and all dates are interpolated in
+    NumPy instead of calling discount() per date. Handles returned by
+    create_flat_forward_curve on those day counts are evaluated in closed
+    form as exp(-r * t). Other handles do not expose the concrete curve
+    type, so they take the per-date path.
+
+    Args:
+        handle: An ORE YieldTermStructureHandle or YieldTermStructure
+        dates: List of ore.Date objects
+
+    Returns:
+        NumPy array of discount factors corresponding to each date
+
+    Example:
+        >>> dates = [eval_date + ore.Period(t, ore.Years) for t in [1, 2, 5, 10]]
+        >>> dfs = get_discount_factors_array(xccy_handle, dates)
+    """
+    if len(dates):
+        flat = getattr(handle, "flat_params", None)
+        if flat is not None:
+            ref_serial, rate, days = flat
+            serials = _date_serials(dates)
+            if serials.min() >= ref_serial:
+                return np.exp(-rate * (serials - ref_serial) / days)
+        elif isinstance(handle, _LOG_LINEAR_DISCOUNT_CURVES):
+            dfs = _log_linear_discounts(handle, _date_serials(dates))
+            if dfs is not None:
+                return dfs
+
+    discount = handle.discount
+    return np.fromiter(
+        (discount(d) for d in dates), dtype=np.float64, count=len(dates)
+    )
+
+
+def get_zero_rates_array(
+    handle: ore.YieldTermStructureHandle,
+    dates: list,
+    day_count: ore.DayCounter = None,
+    compounding: int = None,
+) -> np.ndarray:
+    """
+    Extract zero rates from a curve for a list of dates as a NumPy array.
+
+    Batch variant of get_zero_rates for curve-sampling-heavy paths.
+
+    Args:
+        handle: An ORE YieldTermStructureHandle
+        dates: List of ore.Date objects
+        day_count: Day count convention (defaults to Actual365Fixed)
+        compounding: Compounding convention (defaults to Continuous)
+
+    Returns:
+        NumPy array of zero rates corresponding to each date
+
+    Example:
+        >>> dates = [eval_date + ore.Period(t, ore.Years) for t in [1, 2, 5, 10]]
+        >>> rates = get_zero_rates_array(xccy_handle, dates)
+    """
     if day_count is None:
         day_count = ore.Actual365Fixed()
     if compounding is None:
         compounding = ore.Continuous
 
-    return [handle.zeroRate(d, day_count, compounding).rate() for d in dates]
+    zero_rate = handle.zeroRate
+    return np.fromiter(
+        (zero_rate(d, day_count, compounding).rate() for d in dates),
+        dtype=np.float64,
+        count=len(dates),
+    )
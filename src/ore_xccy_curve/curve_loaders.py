@@ -3,23 +3,92 @@ Utilities for loading yield term structures from files.
 
 Loads curves into QuantLib objects (DiscountCurve or ZeroCurve).
 Since ORE extends QuantLib, these curves are compatible with both libraries.
+JSON input is parsed with orjson when it is installed, falling back to the stdlib.
+Format-specific parsers (pandas, orjson/json, pyarrow) are imported on first
+use so that importing this module stays cheap.
 """
 
-import csv
-import json
+from datetime import date
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, List, Union
 
+import numpy as np
 import ORE as ore
 
+from ore_xccy_curve.curve_converters import _SERIAL_EPOCH
+
 if TYPE_CHECKING:
     import QuantLib as ql
 
 
+# Day counter of loaded curves; immutable, so shared across calls
+_DC_A365 = ore.Actual365Fixed()
+
+# Read buffer for curve files, large enough to take most files in one read
+_READ_BUFFER_SIZE = 1 << 20
+
+
+@lru_cache(maxsize=8192)
 def _iso_to_ore_date(iso_str: str) -> ore.Date:
     """Convert ISO string (YYYY-MM-DD) to ORE/QuantLib Date."""
-    parts = iso_str.split("-")
-    return ore.Date(int(parts[2]), int(parts[1]), int(parts[0]))
+    d = date.fromisoformat(iso_str)
+    return ore.Date(d.day, d.month, d.year)
+
+
+def _iso_array_to_ore_dates(iso_strs) -> List[ore.Date]:
+    """Convert a column of ISO strings to ORE Dates in one vectorized parse.
+
+    The strings are parsed by NumPy and turned into QuantLib serial numbers,
+    so each ORE Date is built from a single integer. Index 0 of the result
+    is reserved for the curve reference date (see _build_curve).
+    """
+    days = np.asarray(iso_strs, dtype="datetime64[D]")
+    serials = (days - _SERIAL_EPOCH).astype(np.int64).tolist()
+    return _serials_to_ore_dates(serials)
+
+
+def _serials_to_ore_dates(serials) -> List[ore.Date]:
+    """Build ORE Dates from serial numbers, reserving index 0."""
+    dates = [None]
+    dates.extend(map(ore.Date, serials))
+    return dates
+
+
+def _reserve_first(values) -> np.ndarray:
+    """Copy values into a float64 array with index 0 reserved."""
+    out = np.empty(len(values) + 1, dtype=np.float64)
+    out[1:] = values
+    return out
+
+
+def _build_curve(
+    ref_date: ore.Date,
+    dates: List[ore.Date],
+    dfs: np.ndarray,
+    zrs: np.ndarray,
+    use_discount_factors: bool,
+) -> "ql.YieldTermStructure":
+    """
+    Build a DiscountCurve or ZeroCurve anchored at the reference date.
+
+    dates, dfs and zrs hold the loaded points from index 1 onwards; index 0
+    is filled in place with the reference-date anchor so no prepended copies
+    are made.
+    """
+    # Both curve types require the first point at the reference date
+    dates[0] = ref_date
+    if use_discount_factors:
+        # DiscountCurve anchors with DF=1.0
+        dfs[0] = 1.0
+        curve = ore.DiscountCurve(dates, dfs, _DC_A365)
+    else:
+        # ZeroCurve anchors with a flat extrapolation of the first zero rate
+        zrs[0] = zrs[1] if len(zrs) > 1 else 0.0
+        curve = ore.ZeroCurve(dates, zrs, _DC_A365)
+
+    curve.enableExtrapolation()
+    return curve
 
 
 def load_curve_from_csv(
@@ -44,49 +113,50 @@ def load_curve_from_csv(
         >>> curve = load_curve_from_csv("gbp_xccy_curve.csv")
         >>> df = curve.discount(target_date)
     """
-    dates = []
-    dfs = []
-    zrs = []
+    import pandas as pd
+
     ref_date = None
+    schema_version = 1
 
-    with open(file_path, "r") as f:
-        reader = csv.reader(f)
-        for row in reader:
-            if not row or row[0].startswith("#"):
-                # Parse metadata from comments
-                if row and row[0] == "# reference_date":
-                    ref_date = _iso_to_ore_date(row[1].strip())
+    # Binary mode with a large buffer: the content is ASCII apart from the
+    # curve name, and pandas reads the body straight from the byte stream
+    with open(file_path, "rb", buffering=_READ_BUFFER_SIZE) as f:
+        # Metadata block: comment lines up to the column header
+        for line in iter(f.readline, b""):
+            if line.startswith(b"#"):
+                key, _, value = line.partition(b",")
+                if key == b"# reference_date":
+                    ref_date = _iso_to_ore_date(value.decode("ascii").strip())
+                elif key == b"# schema_version":
+                    schema_version = int(value)
                 continue
-            if row[0] == "date":
-                continue  # Skip header
+            if line.startswith(b"date"):
+                break  # Column header, data follows
 
-            dt = _iso_to_ore_date(row[0])
-            df = float(row[1])
-            zr = float(row[2])
+        # Parse all numeric columns in C
+        date_dtype = np.int64 if schema_version >= 2 else str
+        frame = pd.read_csv(
+            f,
+            names=["date", "discount_factor", "zero_rate"],
+            header=None,
+            dtype={"date": date_dtype, "discount_factor": np.float64, "zero_rate": np.float64},
+            skip_blank_lines=True,
+        )
 
-            dates.append(dt)
-            dfs.append(df)
-            zrs.append(zr)
+    if schema_version >= 2:
+        dates = _serials_to_ore_dates(frame["date"].tolist())
+    else:
+        dates = _iso_array_to_ore_dates(frame["date"].to_numpy())
+    dfs = _reserve_first(frame["discount_factor"].to_numpy(dtype=np.float64))
+    zrs = _reserve_first(frame["zero_rate"].to_numpy(dtype=np.float64))
 
-    if ref_date is None and dates:
+    if ref_date is None and len(dates) > 1:
         # Use first date as reference if not specified
-        ref_date = dates[0]
+        ref_date = dates[1]
 
     ore.Settings.instance().evaluationDate = ref_date
 
-    if use_discount_factors:
-        # DiscountCurve requires first point at reference date with DF=1.0
-        all_dates = [ref_date] + dates
-        all_values = [1.0] + dfs
-        curve = ore.DiscountCurve(all_dates, all_values, ore.Actual365Fixed())
-    else:
-        # ZeroCurve requires first point at reference date
-        all_dates = [ref_date] + dates
-        all_values = [zrs[0] if zrs else 0.0] + zrs
-        curve = ore.ZeroCurve(all_dates, all_values, ore.Actual365Fixed())
-
-    curve.enableExtrapolation()
-    return curve
+    return _build_curve(ref_date, dates, dfs, zrs, use_discount_factors)
 
 
 def load_curve_from_json(
@@ -96,6 +166,11 @@ def load_curve_from_json(
     """
     Load a yield curve from a JSON file.
 
+    The layout is chosen by the file's schema_version: 1 (or no version)
+    is the original list of per-point objects under "points"; 2 and 3 are
+    the parallel-array layouts written by save_curve_to_json, with ISO
+    dates and QuantLib serial numbers respectively.
+
     Returns a QuantLib-compatible YieldTermStructure (DiscountCurve or ZeroCurve).
     Since ORE extends QuantLib, the returned curve works with both libraries.
 
@@ -111,31 +186,77 @@ def load_curve_from_json(
         >>> curve = load_curve_from_json("gbp_xccy_curve.json")
         >>> df = curve.discount(target_date)
     """
-    with open(file_path, "r") as f:
-        data = json.load(f)
+    with open(file_path, "rb") as f:
+        raw = f.read()
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        data = json.loads(raw)
+    else:
+        data = orjson.loads(raw)
 
     ref_date = _iso_to_ore_date(data["reference_date"])
     ore.Settings.instance().evaluationDate = ref_date
 
-    dates = []
-    dfs = []
-    zrs = []
+    schema_version = data.get("schema_version", 1)
+    if schema_version == 1:
+        # Per-point layout: list of {"date", "discount_factor", "zero_rate"}
+        points = data["points"]
+        dates = _iso_array_to_ore_dates([point["date"] for point in points])
+        dfs = _reserve_first([point["discount_factor"] for point in points])
+        zrs = _reserve_first([point["zero_rate"] for point in points])
+    elif schema_version in (2, 3):
+        if schema_version == 3:
+            dates = _serials_to_ore_dates(data["date_serials"])
+        else:
+            dates = _iso_array_to_ore_dates(data["dates"])
+        dfs = _reserve_first(data["discount_factors"])
+        zrs = _reserve_first(data["zero_rates"])
+    else:
+        raise ValueError(f"Unknown JSON schema_version: {schema_version}")
 
-    for point in data["points"]:
-        dates.append(_iso_to_ore_date(point["date"]))
-        dfs.append(point["discount_factor"])
-        zrs.append(point["zero_rate"])
+    return _build_curve(ref_date, dates, dfs, zrs, use_discount_factors)
 
-    if use_discount_factors:
-        # DiscountCurve requires first point at reference date with DF=1.0
-        all_dates = [ref_date] + dates
-        all_values = [1.0] + dfs
-        curve = ore.DiscountCurve(all_dates, all_values, ore.Actual365Fixed())
-    else:
-        # ZeroCurve requires first point at reference date
-        all_dates = [ref_date] + dates
-        all_values = [zrs[0] if zrs else 0.0] + zrs
-        curve = ore.ZeroCurve(all_dates, all_values, ore.Actual365Fixed())
 
-    curve.enableExtrapolation()
-    return curve
+def load_curve_from_parquet(
+    file_path: Union[str, Path],
+    use_discount_factors: bool = True,
+) -> "ql.YieldTermStructure":
+    """
+    Load a yield curve from a Parquet file written by save_curve_to_parquet.
+
+    Dates are stored as QuantLib serial numbers, so no string parsing is
+    needed. Requires pyarrow.
+
+    Args:
+        file_path: Path to the Parquet file
+        use_discount_factors: If True, build curve from discount factors.
+                              If False, build from zero rates.
+
+    Returns:
+        QuantLib YieldTermStructure (DiscountCurve or ZeroCurve)
+
+    Example:
+        >>> curve = load_curve_from_parquet("gbp_xccy_curve.parquet")
+        >>> df = curve.discount(target_date)
+    """
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow is required for Parquet curve files: pip install pyarrow"
+        ) from e
+
+    table = pq.read_table(file_path)
+    metadata = table.schema.metadata
+
+    ref_date = ore.Date(int(metadata[b"reference_date_serial"]))
+    ore.Settings.instance().evaluationDate = ref_date
+
+    dates = _serials_to_ore_dates(table["date_serial"].to_pylist())
+    dfs = _reserve_first(table["discount_factor"].to_numpy())
+    zrs = _reserve_first(table["zero_rate"].to_numpy())
+
+    return _build_curve(ref_date, dates, dfs, zrs, use_discount_factors)
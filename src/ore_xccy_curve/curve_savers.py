@@ -1,17 +1,22 @@
 """
 Utilities for saving ORE yield term structures to files.
 
-Supports CSV and JSON formats for curve persistence.
+Supports CSV, JSON and Parquet formats for curve persistence.
+JSON output uses orjson when it is installed, falling back to the stdlib.
+Parquet output requires pyarrow. Format-specific modules (orjson/json,
+pyarrow) and the thread pool are imported on first use so that importing
+this module stays cheap.
 """
 
-import csv
-import json
+import math
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import ORE as ore
 
-from ore_xccy_curve.curve_converters import ore_handle_to_curve
+from ore_xccy_curve.curve_converters import _SERIAL_EPOCH, ore_handle_to_curve
 
 
 def _ore_date_to_iso(ore_date: ore.Date) -> str:
@@ -19,6 +24,57 @@ def _ore_date_to_iso(ore_date: ore.Date) -> str:
     return f"{ore_date.year()}-{ore_date.month():02d}-{ore_date.dayOfMonth():02d}"
 
 
+# Schema versions: 1 stores ISO date strings, 2 stores QuantLib serial numbers
+_FORMAT_VERSIONS = (1, 2)
+
+# JSON schema_version written for each format_version. JSON schema 1 is the
+# original per-point "points" layout (written without a version key), so the
+# parallel-array layouts are numbered after it: 2 with ISO dates, 3 with
+# serial numbers.
+_JSON_SCHEMA_VERSIONS = {1: 2, 2: 3}
+
+
+def _serials_to_iso(serials: List[int]) -> List[str]:
+    """Format QuantLib serial numbers as ISO date strings in one vectorized pass."""
+    days = _SERIAL_EPOCH + np.asarray(serials, dtype="timedelta64[D]")
+    return np.datetime_as_string(days, unit="D").tolist()
+
+
+def _csv_field(value: str) -> str:
+    """Quote a free-form CSV field the way csv.writer's QUOTE_MINIMAL does."""
+    if any(c in value for c in ',"\r\n'):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def _check_format_version(format_version: int) -> None:
+    """Raise ValueError for unsupported file schema versions."""
+    if format_version not in _FORMAT_VERSIONS:
+        raise ValueError(
+            f"Unknown format_version: {format_version}. "
+            f"Available: {list(_FORMAT_VERSIONS)}"
+        )
+
+
+# Day counter for exported zero rates; immutable, so shared across calls
+_DC_A365 = ore.Actual365Fixed()
+
+
+@lru_cache(maxsize=256)
+def _period(tenor: str) -> ore.Period:
+    """Parse a tenor string (e.g., "3M", "1D", "1Y6M") to an ORE Period, memoized."""
+    return ore.Period(tenor)
+
+
+@lru_cache(maxsize=64)
+def _default_tenors(max_years: int) -> Tuple[str, ...]:
+    """Default tenor grid: short tenors plus yearly points up to max_years."""
+    return tuple(
+        ["1W", "2W", "1M", "2M", "3M", "6M", "9M"]
+        + [f"{y}Y" for y in range(1, min(max_years + 1, 51))]
+    )
+
+
 def extract_curve_points(
     handle: ore.YieldTermStructureHandle,
     tenors: List[str] = None,
@@ -36,30 +92,67 @@ def extract_curve_points(
     Returns:
         List of tuples: (iso_date, discount_factor, zero_rate)
     """
+    _, serials, dfs, zeros = _extract_curve_columns(handle, tenors, max_years)
+    return list(zip(_serials_to_iso(serials), dfs.tolist(), zeros.tolist()))
+
+
+def _extract_curve_columns(
+    handle: ore.YieldTermStructureHandle,
+    tenors: List[str] = None,
+    max_years: int = 50,
+) -> Tuple[ore.Date, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Extract curve points as parallel columns.
+
+    Returns the curve's reference date followed by int32 date serial numbers,
+    float64 discount factors and float64 continuous zero rates, so savers can
+    format or store each column in bulk. Points the curve cannot evaluate
+    (ORE raises RuntimeError) are skipped, as are points past the curve's
+    max date when it does not extrapolate.
+    """
     curve = ore_handle_to_curve(handle)
     ref_date = curve.referenceDate()
-    day_count = ore.Actual365Fixed()
+    day_count = _DC_A365
 
     if tenors is None:
-        # Default tenor grid
-        tenors = (
-            ["1W", "2W", "1M", "2M", "3M", "6M", "9M"]
-            + [f"{y}Y" for y in range(1, min(max_years + 1, 51))]
-        )
+        tenors = _default_tenors(max_years)
+
+    # Hoist lookups out of the per-tenor loop
+    discount = handle.discount
+    zero_rate = handle.zeroRate
+    year_fraction = day_count.yearFraction
+    continuous = ore.Continuous
+    log = math.log
+
+    # Tenors beyond the curve range are skipped unless it extrapolates
+    max_date = None if curve.allowsExtrapolation() else curve.maxDate()
 
-    points = []
+    n = len(tenors)
+    serials = np.empty(n, dtype=np.int32)
+    dfs = np.empty(n, dtype=np.float64)
+    zeros = np.empty(n, dtype=np.float64)
+    i = 0
     for tenor in tenors:
+        target_date = ref_date + _period(tenor)
+        if max_date is not None and target_date > max_date:
+            continue
         try:
-            period = ore.Period(tenor)
-            target_date = ref_date + period
-            df = handle.discount(target_date)
-            zero = handle.zeroRate(target_date, day_count, ore.Continuous).rate()
-            points.append((_ore_date_to_iso(target_date), df, zero))
+            df = discount(target_date)
+            # Continuous zero rate from the DF, avoiding a second curve lookup
+            t = year_fraction(ref_date, target_date)
+            if t > 0:
+                zero = -log(df) / t
+            else:
+                zero = zero_rate(target_date, day_count, continuous).rate()
         except RuntimeError:
-            # Skip tenors that fail (e.g., beyond curve range)
+            # Skip points the curve cannot evaluate (e.g., a failed bootstrap)
             continue
+        serials[i] = target_date.serialNumber()
+        dfs[i] = df
+        zeros[i] = zero
+        i += 1
 
-    return points
+    return ref_date, serials[:i], dfs[:i], zeros[:i]
 
 
 def save_curve_to_csv(
@@ -67,37 +160,105 @@ def save_curve_to_csv(
     file_path: Union[str, Path],
     tenors: List[str] = None,
     curve_name: str = "curve",
+    format_version: int = 1,
 ) -> None:
     """
     Save an ORE curve to a CSV file.
 
     The CSV contains columns: date, discount_factor, zero_rate
-    The reference date is stored in the header comment.
+    (date_serial instead of date for format_version=2).
+    The reference date and schema version are stored in the header comment.
 
     Args:
         handle: An ORE YieldTermStructureHandle
         file_path: Path to save the CSV file
         tenors: Optional list of tenors to extract
         curve_name: Name to include in the file header
+        format_version: 1 writes ISO dates, 2 writes QuantLib serial numbers
 
     Example:
         >>> save_curve_to_csv(xccy_handle, "gbp_xccy_curve.csv", curve_name="GBP_XCCY")
     """
-    curve = ore_handle_to_curve(handle)
-    ref_date = curve.referenceDate()
-    points = extract_curve_points(handle, tenors)
+    _check_format_version(format_version)
+    ref_date, serials, dfs, zeros = _extract_curve_columns(handle, tenors)
+
+    if format_version == 2:
+        date_column = "date_serial"
+        dates = serials.tolist()
+    else:
+        date_column = "date"
+        dates = _serials_to_iso(serials)
+
+    # Header with metadata, followed by an empty separator row
+    header = (
+        f"# curve_name,{_csv_field(curve_name)}\r\n"
+        f"# reference_date,{_ore_date_to_iso(ref_date)}\r\n"
+        "# day_count,Actual365Fixed\r\n"
+        "# compounding,Continuous\r\n"
+        f"# schema_version,{format_version}\r\n"
+        "\r\n"
+        f"{date_column},discount_factor,zero_rate\r\n"
+    )
+    # Data rows need no quoting, so they are formatted directly
+    rows = "".join(
+        f"{dt},{df:.15f},{zr:.10f}\r\n"
+        for dt, df, zr in zip(dates, dfs.tolist(), zeros.tolist())
+    )
+
+    # Whole file in a single write of pre-encoded bytes
+    with open(file_path, "wb") as f:
+        f.write((header + rows).encode("utf-8"))
+
+
+def save_curves_to_csv(
+    handles: Dict[str, ore.YieldTermStructureHandle],
+    directory: Union[str, Path],
+    tenors: List[str] = None,
+    max_workers: Optional[int] = None,
+) -> List[Path]:
+    """
+    Save several curves to CSV files, one file per curve.
+
+    Each curve is written to ``<directory>/<name>.csv`` with ``name`` used as
+    the curve name. Curves are written one after another by default.
+
+    Passing ``max_workers`` fans the saves out over a thread pool of that
+    size. Only do so when the handles are independent and already
+    bootstrapped: sampling a curve can trigger its lazy bootstrap, which is
+    not thread-safe for curves that share inputs (e.g. XCCY curves built
+    over the same OIS handle), and the ORE evaluation date is process-global.
+
+    Args:
+        handles: Mapping of curve name to ORE YieldTermStructureHandle
+        directory: Directory to write the CSV files into (created if missing)
+        tenors: Optional list of tenors to extract for every curve
+        max_workers: Thread pool size; None (the default) saves serially
+
+    Returns:
+        List of written file paths, in the order of ``handles``
+
+    Example:
+        >>> save_curves_to_csv({"GBP_XCCY": gbp_handle, "EUR_XCCY": eur_handle}, "curves")
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = [directory / f"{name}.csv" for name in handles]
+
+    def _save(item: Tuple[Tuple[str, ore.YieldTermStructureHandle], Path]) -> None:
+        (name, handle), path = item
+        save_curve_to_csv(handle, path, tenors=tenors, curve_name=name)
+
+    items = zip(handles.items(), paths)
+    if max_workers is None:
+        for item in items:
+            _save(item)
+    else:
+        from concurrent.futures import ThreadPoolExecutor
 
-    with open(file_path, "w", newline="") as f:
-        writer = csv.writer(f)
-        # Header with metadata
-        writer.writerow(["# curve_name", curve_name])
-        writer.writerow(["# reference_date", _ore_date_to_iso(ref_date)])
-        writer.writerow(["# day_count", "Actual365Fixed"])
-        writer.writerow(["# compounding", "Continuous"])
-        writer.writerow([])  # Empty row separator
-        writer.writerow(["date", "discount_factor", "zero_rate"])
-        for dt, df, zr in points:
-            writer.writerow([dt, f"{df:.15f}", f"{zr:.10f}"])
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(_save, items))
+
+    return paths
 
 
 def save_curve_to_json(
@@ -105,33 +266,103 @@ def save_curve_to_json(
     file_path: Union[str, Path],
     tenors: List[str] = None,
     curve_name: str = "curve",
+    format_version: int = 1,
 ) -> None:
     """
     Save an ORE curve to a JSON file.
 
+    Points are stored as three parallel arrays (dates, discount_factors,
+    zero_rates) so they can be loaded without iterating per-point objects.
+    With format_version=2 the dates are stored as QuantLib serial numbers
+    under date_serials. The file's schema_version is 2 for ISO dates and 3
+    for serial numbers; schema 1 is the original per-point layout.
+
     Args:
         handle: An ORE YieldTermStructureHandle
         file_path: Path to save the JSON file
         tenors: Optional list of tenors to extract
         curve_name: Name to include in the metadata
+        format_version: 1 writes ISO dates, 2 writes QuantLib serial numbers
 
     Example:
         >>> save_curve_to_json(xccy_handle, "gbp_xccy_curve.json", curve_name="GBP_XCCY")
     """
-    curve = ore_handle_to_curve(handle)
-    ref_date = curve.referenceDate()
-    points = extract_curve_points(handle, tenors)
+    _check_format_version(format_version)
+    ref_date, serials, dfs, zeros = _extract_curve_columns(handle, tenors)
 
     data = {
+        "schema_version": _JSON_SCHEMA_VERSIONS[format_version],
         "curve_name": curve_name,
         "reference_date": _ore_date_to_iso(ref_date),
         "day_count": "Actual365Fixed",
         "compounding": "Continuous",
-        "points": [
-            {"date": dt, "discount_factor": df, "zero_rate": zr}
-            for dt, df, zr in points
-        ],
     }
+    if format_version == 2:
+        data["date_serials"] = serials.tolist()
+    else:
+        data["dates"] = _serials_to_iso(serials)
+    data["discount_factors"] = dfs.tolist()
+    data["zero_rates"] = zeros.tolist()
+
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        with open(file_path, "w") as f:
+            json.dump(data, f, indent=2)
+    else:
+        with open(file_path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+
+def save_curve_to_parquet(
+    handle: ore.YieldTermStructureHandle,
+    file_path: Union[str, Path],
+    tenors: List[str] = None,
+    curve_name: str = "curve",
+) -> None:
+    """
+    Save an ORE curve to a Parquet file.
+
+    Dates are stored as int32 QuantLib serial numbers and discount factors /
+    zero rates as raw float64 columns, giving a compact binary file that
+    loads without any text parsing. Metadata is kept in the schema.
+    Requires pyarrow.
+
+    Args:
+        handle: An ORE YieldTermStructureHandle
+        file_path: Path to save the Parquet file
+        tenors: Optional list of tenors to extract
+        curve_name: Name to include in the metadata
+
+    Example:
+        >>> save_curve_to_parquet(xccy_handle, "gbp_xccy_curve.parquet", curve_name="GBP_XCCY")
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow is required for Parquet curve files: pip install pyarrow"
+        ) from e
+
+    ref_date, serials, dfs, zeros = _extract_curve_columns(handle, tenors)
 
-    with open(file_path, "w") as f:
-        json.dump(data, f, indent=2)
+    table = pa.table(
+        {
+            "date_serial": serials,
+            "discount_factor": dfs,
+            "zero_rate": zeros,
+        }
+    )
+    table = table.replace_schema_metadata(
+        {
+            "curve_name": curve_name,
+            "reference_date": _ore_date_to_iso(ref_date),
+            "reference_date_serial": str(ref_date.serialNumber()),
+            "day_count": "Actual365Fixed",
+            "compounding": "Continuous",
+        }
+    )
+    pq.write_table(table, file_path, compression="zstd")
@@ -9,39 +9,46 @@ from external sources. This demo uses OISCurveBuilder with dummy rates.
 """
 
 from datetime import timedelta
-from typing import List, Tuple
+from typing import Tuple
 
 import ORE as ore
 
 from ore_xccy_curve.curve_builder import OISCurveBuilder, build_xccy_curve
 from ore_xccy_curve.market_data import MarketDataFactory
 
+# Dummy OIS rates for the demo (these would come from external sources in production)
+USD_OIS_RATES: Tuple[Tuple[str, float], ...] = (
+    ("1M", 0.0525), ("3M", 0.0530), ("6M", 0.0528), ("1Y", 0.0510),
+    ("2Y", 0.0465), ("3Y", 0.0430), ("5Y", 0.0395), ("7Y", 0.0385),
+    ("10Y", 0.0380), ("15Y", 0.0385), ("20Y", 0.0390), ("30Y", 0.0395),
+)
 
-def get_dummy_usd_ois_rates() -> List[Tuple[str, float]]:
+GBP_OIS_RATES: Tuple[Tuple[str, float], ...] = (
+    ("1M", 0.0515), ("3M", 0.0520), ("6M", 0.0510), ("1Y", 0.0485),
+    ("2Y", 0.0440), ("3Y", 0.0405), ("5Y", 0.0375), ("7Y", 0.0365),
+    ("10Y", 0.0360), ("15Y", 0.0365), ("20Y", 0.0370), ("30Y", 0.0375),
+)
+
+EUR_OIS_RATES: Tuple[Tuple[str, float], ...] = (
+    ("1M", 0.0390), ("3M", 0.0395), ("6M", 0.0388), ("1Y", 0.0365),
+    ("2Y", 0.0320), ("3Y", 0.0290), ("5Y", 0.0265), ("7Y", 0.0260),
+    ("10Y", 0.0258), ("15Y", 0.0265), ("20Y", 0.0270), ("30Y", 0.0275),
+)
+
+
+def get_dummy_usd_ois_rates() -> Tuple[Tuple[str, float], ...]:
     """Get dummy USD SOFR OIS rates for demo purposes."""
-    return [
-        ("1M", 0.0525), ("3M", 0.0530), ("6M", 0.0528), ("1Y", 0.0510),
-        ("2Y", 0.0465), ("3Y", 0.0430), ("5Y", 0.0395), ("7Y", 0.0385),
-        ("10Y", 0.0380), ("15Y", 0.0385), ("20Y", 0.0390), ("30Y", 0.0395),
-    ]
+    return USD_OIS_RATES
 
 
-def get_dummy_gbp_ois_rates() -> List[Tuple[str, float]]:
+def get_dummy_gbp_ois_rates() -> Tuple[Tuple[str, float], ...]:
     """Get dummy GBP SONIA OIS rates for demo purposes."""
-    return [
-        ("1M", 0.0515), ("3M", 0.0520), ("6M", 0.0510), ("1Y", 0.0485),
-        ("2Y", 0.0440), ("3Y", 0.0405), ("5Y", 0.0375), ("7Y", 0.0365),
-        ("10Y", 0.0360), ("15Y", 0.0365), ("20Y", 0.0370), ("30Y", 0.0375),
-    ]
+    return GBP_OIS_RATES
 
 
-def get_dummy_eur_ois_rates() -> List[Tuple[str, float]]:
+def get_dummy_eur_ois_rates() -> Tuple[Tuple[str, float], ...]:
     """Get dummy EUR ESTR OIS rates for demo purposes."""
-    return [
-        ("1M", 0.0390), ("3M", 0.0395), ("6M", 0.0388), ("1Y", 0.0365),
-        ("2Y", 0.0320), ("3Y", 0.0290), ("5Y", 0.0265), ("7Y", 0.0260),
-        ("10Y", 0.0258), ("15Y", 0.0265), ("20Y", 0.0270), ("30Y", 0.0275),
-    ]
+    return EUR_OIS_RATES
 
 
 def main():
@@ -93,9 +100,9 @@ def main():
     # Example forward calculations
     print("\nExample Forward Rate Calculations (GBPUSD):")
     print("-" * 50)
-    for days in [90, 365, 365 * 5]:
-        fwd_date = val_date + timedelta(days=days)
-        fx_fwd = xccy_builder.get_implied_fx_forward(fwd_date)
+    fwd_dates = [val_date + timedelta(days=days) for days in [90, 365, 365 * 5]]
+    fx_fwds = xccy_builder.get_implied_fx_forwards(fwd_dates)
+    for fwd_date, fx_fwd in zip(fwd_dates, fx_fwds):
         print(f"  {fwd_date}: {fx_fwd:.4f}")
 
     # Bootstrap EURUSD
@@ -106,7 +113,7 @@ def main():
     market_data = MarketDataFactory.create_eurusd()
     market_data.print_summary()
 
-    # Build EUR input curve
+    # Build EUR input curve; the USD curve built above is shared with GBPUSD
     eur_curve = OISCurveBuilder(
         eval_date, market_data.foreign_ccy, get_dummy_eur_ois_rates()
     ).build()
@@ -5,38 +5,115 @@ Contains FX spot, FX forwards, and cross-currency basis swap quotes.
 Supports any currency pair configuration.
 """
 
+import re
+import sys
 from dataclasses import dataclass, field
 from datetime import date
-from typing import Dict, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, NamedTuple, Optional, Sequence, TextIO, Tuple
 
+import numpy as np
 
-@dataclass
+# Tenor strings: a count followed by a week, month or year unit (e.g., "6M")
+_TENOR_RE = re.compile(r"(\d+)([WMY])")
+
+# Nominal length in years of one unit of each tenor suffix
+_TENOR_UNIT_YEARS = {"W": 7.0 / 365.0, "M": 1.0 / 12.0, "Y": 1.0}
+
+
+@lru_cache(maxsize=None)
+def _parse_tenor(tenor: str) -> Tuple[int, str]:
+    """
+    Split a tenor string into (count, unit), e.g. "6M" -> (6, "M").
+
+    This is the single tenor parser for the package; the curve builder and
+    savers build ORE Periods from its result.
+    """
+    match = _TENOR_RE.fullmatch(tenor)
+    if match is None:
+        raise ValueError(f"Unknown tenor format: {tenor}")
+    return int(match.group(1)), match.group(2)
+
+
+def _tenor_years(tenor: str) -> float:
+    """Nominal tenor length in years (e.g., "6M" -> 0.5), ignoring calendars."""
+    count, unit = _parse_tenor(tenor)
+    return count * _TENOR_UNIT_YEARS[unit]
+
+
+@dataclass(slots=True)
 class FXForwardQuote:
     """FX Forward quote data."""
 
     tenor: str  # e.g., "1M", "3M", "6M", "1Y"
     forward_points: float  # Forward points in pips
 
+    def __post_init__(self):
+        """Intern the tenor so tenor-keyed lookups compare by identity."""
+        self.tenor = sys.intern(self.tenor)
+
 
-@dataclass
+@dataclass(slots=True)
 class XCCYBasisSwapQuote:
     """Cross-currency basis swap quote data."""
 
     tenor: str  # e.g., "2Y", "5Y", "10Y"
     basis_spread: float  # Basis spread in bps
 
+    def __post_init__(self):
+        """Intern the tenor so tenor-keyed lookups compare by identity."""
+        self.tenor = sys.intern(self.tenor)
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CurrencyConfig:
-    """Configuration for a currency in XCCY curve building."""
+    """Configuration for a currency in XCCY curve building.
+
+    Frozen because instances in MarketDataFactory.CURRENCY_CONFIGS are shared
+    by every market data object built from them.
+    """
 
     ccy: str  # ISO currency code (e.g., "USD", "GBP", "EUR")
     ois_index_name: str  # OIS index name (e.g., "SOFR", "SONIA", "ESTR")
     calendar_name: str  # Calendar identifier
     day_count: str = "Actual360"  # Day count convention
 
+    def __post_init__(self):
+        """Intern the identifiers used as registry and cache keys."""
+        for name in ("ccy", "ois_index_name", "calendar_name", "day_count"):
+            object.__setattr__(self, name, sys.intern(getattr(self, name)))
+
+
+class XCCYMarketDataArrays(NamedTuple):
+    """
+    Plain-array view of XCCYMarketData.
+
+    Holds only scalars and float64 arrays, so it can be passed to compiled
+    or vectorized kernels that do not understand dataclasses.
+    """
+
+    valuation_ordinal: int  # date.toordinal() of the valuation date
+    fx_spot: float
+    fwd_points: np.ndarray  # Forward points in pips
+    fwd_years: np.ndarray  # Nominal forward tenors in years
+    basis_bps: np.ndarray  # Basis spreads in bps
+    swap_years: np.ndarray  # Nominal swap tenors in years
+
+
+def _find_by_tenor(quotes: list, tenor: str):
+    """Return the first quote listed for a tenor.
+
+    A linear scan over a handful of quotes, so lookups always see the
+    current list, however it was edited.
+    """
+    for quote in quotes:
+        if quote.tenor == tenor:
+            return quote
+    raise ValueError(f"Unknown tenor: {tenor}")
+
 
-@dataclass
+@dataclass(slots=True)
 class XCCYMarketData:
     """
     Market data for cross-currency curve bootstrapping.
@@ -56,6 +133,9 @@ class XCCYMarketData:
     - fx_base_ccy indicates which currency is the FX base (first in pair name)
     - For GBPUSD: fx_base_ccy="GBP" (not collateral)
     - For USDJPY: fx_base_ccy="USD" (equals collateral)
+
+    Tenor lookups always reflect the current quote lists, including quotes
+    edited, replaced, added or removed after construction.
     """
 
     valuation_date: date
@@ -92,53 +172,114 @@ class XCCYMarketData:
         """
         return self.fx_base_ccy == self.domestic_ccy.ccy
 
+    def _forward_quote(self, tenor: str) -> FXForwardQuote:
+        """Look up the FX forward quote for a tenor."""
+        return _find_by_tenor(self.fx_forwards, tenor)
+
+    def _basis_quote(self, tenor: str) -> XCCYBasisSwapQuote:
+        """Look up the basis swap quote for a tenor."""
+        return _find_by_tenor(self.xccy_basis_swaps, tenor)
+
     def get_forward_rate(self, tenor: str) -> float:
         """Get the outright forward rate for a given tenor."""
-        for fwd in self.fx_forwards:
-            if fwd.tenor == tenor:
-                return self.fx_spot + (fwd.forward_points / 10000.0)
-        raise ValueError(f"Unknown tenor: {tenor}")
+        return self.fx_spot + (self._forward_quote(tenor).forward_points / 10000.0)
 
     def get_basis_spread_bps(self, tenor: str) -> float:
         """Get the cross-currency basis spread in basis points."""
-        for swap in self.xccy_basis_swaps:
-            if swap.tenor == tenor:
-                return swap.basis_spread
-        raise ValueError(f"Unknown tenor: {tenor}")
-
-    def print_summary(self) -> None:
-        """Print a summary of the market data."""
-        print(f"\n{'='*60}")
-        print(f"{self.ccy_pair} Market Data Summary - {self.valuation_date}")
-        print(f"{'='*60}")
-        print(f"\nFX Spot: {self.fx_spot:.4f}")
-
-        print(f"\n{'FX Forwards':-^40}")
-        print(f"{'Tenor':<10} {'Points':<12} {'Outright':<12}")
-        for fwd in self.fx_forwards:
-            outright = self.fx_spot + (fwd.forward_points / 10000.0)
-            print(f"{fwd.tenor:<10} {fwd.forward_points:<12.1f} {outright:<12.4f}")
-
-        print(f"\n{'XCCY Basis Swaps':-^40}")
-        print(f"{'Tenor':<10} {'Spread (bps)':<15}")
-        for swap in self.xccy_basis_swaps:
-            print(f"{swap.tenor:<10} {swap.basis_spread:<15.1f}")
-        print()
+        return self._basis_quote(tenor).basis_spread
+
+    def get_forward_rates(self, tenors: Sequence[str]) -> np.ndarray:
+        """Get outright forward rates for several tenors as a float64 array."""
+        lookup = self._forward_quote
+        points = np.fromiter(
+            (lookup(t).forward_points for t in tenors), dtype=np.float64, count=len(tenors)
+        )
+        return self.fx_spot + points / 10000.0
+
+    def get_basis_spreads(self, tenors: Sequence[str]) -> np.ndarray:
+        """Get basis spreads in bps for several tenors as a float64 array."""
+        lookup = self._basis_quote
+        return np.fromiter(
+            (lookup(t).basis_spread for t in tenors), dtype=np.float64, count=len(tenors)
+        )
+
+    def as_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return the quotes as parallel float64 arrays for vectorized math.
+
+        Tenor lengths are nominal (1W = 7/365, 1M = 1/12, 1Y = 1 year) and
+        ignore calendars; use the curve builder for exact schedule dates.
+
+        Returns:
+            Tuple of (fwd_points, fwd_years, basis_bps, swap_years), with
+            forward points in pips and basis spreads in bps
+        """
+        fwds = self.fx_forwards
+        swaps = self.xccy_basis_swaps
+        return (
+            np.fromiter((q.forward_points for q in fwds), dtype=np.float64, count=len(fwds)),
+            np.fromiter((_tenor_years(q.tenor) for q in fwds), dtype=np.float64, count=len(fwds)),
+            np.fromiter((q.basis_spread for q in swaps), dtype=np.float64, count=len(swaps)),
+            np.fromiter((_tenor_years(q.tenor) for q in swaps), dtype=np.float64, count=len(swaps)),
+        )
+
+    def to_array_tuple(self) -> XCCYMarketDataArrays:
+        """Return a NamedTuple of scalars and arrays built from as_arrays()."""
+        return XCCYMarketDataArrays(
+            self.valuation_date.toordinal(), float(self.fx_spot), *self.as_arrays()
+        )
+
+    def print_summary(self, file: Optional[TextIO] = None) -> None:
+        """
+        Print a summary of the market data.
+
+        Args:
+            file: Stream to write to (defaults to sys.stdout)
+        """
+        fx_spot = self.fx_spot
+        lines = [
+            f"\n{'='*60}",
+            f"{self.ccy_pair} Market Data Summary - {self.valuation_date}",
+            f"{'='*60}",
+            f"\nFX Spot: {fx_spot:.4f}",
+            f"\n{'FX Forwards':-^40}",
+            f"{'Tenor':<10} {'Points':<12} {'Outright':<12}",
+        ]
+        lines.extend(
+            f"{fwd.tenor:<10} {fwd.forward_points:<12.1f} "
+            f"{fx_spot + (fwd.forward_points / 10000.0):<12.4f}"
+            for fwd in self.fx_forwards
+        )
+        lines.append(f"\n{'XCCY Basis Swaps':-^40}")
+        lines.append(f"{'Tenor':<10} {'Spread (bps)':<15}")
+        lines.extend(
+            f"{swap.tenor:<10} {swap.basis_spread:<15.1f}"
+            for swap in self.xccy_basis_swaps
+        )
+        lines.append("")
+
+        # One write for the whole block
+        print("\n".join(lines), file=file)
+
+
+# Predefined currency configurations, exposed read-only as
+# MarketDataFactory.CURRENCY_CONFIGS
+_CURRENCY_CONFIGS: Dict[str, CurrencyConfig] = {
+    "USD": CurrencyConfig("USD", "SOFR", "US-FederalReserve", "Actual360"),
+    "GBP": CurrencyConfig("GBP", "SONIA", "UK-Exchange", "Actual365Fixed"),
+    "EUR": CurrencyConfig("EUR", "ESTR", "TARGET", "Actual360"),
+    "JPY": CurrencyConfig("JPY", "TONAR", "Japan", "Actual365Fixed"),
+    "CHF": CurrencyConfig("CHF", "SARON", "Switzerland", "Actual360"),
+    "AUD": CurrencyConfig("AUD", "AONIA", "Australia", "Actual365Fixed"),
+    "CAD": CurrencyConfig("CAD", "CORRA", "Canada", "Actual365Fixed"),
+}
 
 
 class MarketDataFactory:
     """Factory for creating market data with dummy values for various currency pairs."""
 
-    # Predefined currency configurations
-    CURRENCY_CONFIGS: Dict[str, CurrencyConfig] = {
-        "USD": CurrencyConfig("USD", "SOFR", "US-FederalReserve", "Actual360"),
-        "GBP": CurrencyConfig("GBP", "SONIA", "UK-Exchange", "Actual365Fixed"),
-        "EUR": CurrencyConfig("EUR", "ESTR", "TARGET", "Actual360"),
-        "JPY": CurrencyConfig("JPY", "TONAR", "Japan", "Actual365Fixed"),
-        "CHF": CurrencyConfig("CHF", "SARON", "Switzerland", "Actual360"),
-        "AUD": CurrencyConfig("AUD", "AONIA", "Australia", "Actual365Fixed"),
-        "CAD": CurrencyConfig("CAD", "CORRA", "Canada", "Actual365Fixed"),
-    }
+    # Predefined currency configurations (read-only view; configs are shared)
+    CURRENCY_CONFIGS: Mapping[str, CurrencyConfig] = MappingProxyType(_CURRENCY_CONFIGS)
 
     @classmethod
     def create_gbpusd(cls, valuation_date: Optional[date] = None) -> XCCYMarketData:
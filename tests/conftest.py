@@ -0,0 +1,73 @@
+"""Shared pytest fixtures."""
+
+from contextlib import contextmanager
+
+import pytest
+
+try:
+    import ORE as ore
+
+    ORE_AVAILABLE = True
+except ImportError:
+    ORE_AVAILABLE = False
+    ore = None
+
+# Modules that need ORE at import time (their fixtures annotate with ore.Date);
+# without ORE they are not collected at all rather than failing on import.
+collect_ignore_glob = [] if ORE_AVAILABLE else ["test_converters.py", "test_curve_builder.py"]
+
+# Evaluation date (day, month, year) used throughout the test suite
+EVAL_DATE = (15, 1, 2024)
+
+
+def _set_eval_date(d) -> None:
+    """Set the ORE evaluation date, skipping the write if it is unchanged.
+
+    Every assignment notifies all observing term structures, so writing the
+    same date again would still force curves to recalculate.
+    """
+    settings = ore.Settings.instance()
+    if settings.evaluationDate != d:
+        settings.evaluationDate = d
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _ore_eval_date():
+    """Set the ORE evaluation date once for the whole session.
+
+    The evaluation date lives on a process-global singleton, so it is shared
+    by every test; use ``with_eval_date`` to move it temporarily.
+    """
+    if ORE_AVAILABLE:
+        _set_eval_date(ore.Date(*EVAL_DATE))
+    yield
+
+
+@pytest.fixture(autouse=True)
+def _restore_eval_date(_ore_eval_date):
+    """Put the session evaluation date back if a test (or loader) moved it."""
+    yield
+    if ORE_AVAILABLE:
+        _set_eval_date(ore.Date(*EVAL_DATE))
+
+
+@pytest.fixture
+def with_eval_date():
+    """Return a context manager that temporarily sets the ORE evaluation date.
+
+    Example:
+        >>> with with_eval_date(ore.Date(1, 7, 2024)):
+        ...     curve = OISCurveBuilder(...).build()
+    """
+
+    @contextmanager
+    def _with_eval_date(d):
+        settings = ore.Settings.instance()
+        previous = settings.evaluationDate
+        _set_eval_date(d)
+        try:
+            yield d
+        finally:
+            _set_eval_date(previous)
+
+    return _with_eval_date
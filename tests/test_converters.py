@@ -3,6 +3,7 @@
 import tempfile
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 # Try to import ORE - skip tests if not available
@@ -11,7 +12,9 @@ try:
     from ore_xccy_curve.curve_converters import (
         create_flat_forward_curve,
         get_discount_factors,
+        get_discount_factors_array,
         get_zero_rates,
+        get_zero_rates_array,
         ore_curve_to_quantlib,
         ore_handle_to_curve,
         quantlib_curve_to_ore_handle,
@@ -20,11 +23,14 @@ try:
     from ore_xccy_curve.curve_loaders import (
         load_curve_from_csv,
         load_curve_from_json,
+        load_curve_from_parquet,
     )
     from ore_xccy_curve.curve_savers import (
         extract_curve_points,
         save_curve_to_csv,
         save_curve_to_json,
+        save_curve_to_parquet,
+        save_curves_to_csv,
     )
 
     ORE_AVAILABLE = True
@@ -32,17 +38,16 @@ except ImportError:
     ORE_AVAILABLE = False
     ore = None
 
+pytestmark = pytest.mark.skipif(not ORE_AVAILABLE, reason="ORE not installed")
+
 
-@pytest.mark.skipif(not ORE_AVAILABLE, reason="ORE not installed")
 class TestQuantLibToOreHandle:
     """Tests for quantlib_curve_to_ore_handle."""
 
     @pytest.fixture
     def eval_date(self) -> ore.Date:
         """Create evaluation date."""
-        d = ore.Date(15, 1, 2024)
-        ore.Settings.instance().evaluationDate = d
-        return d
+        return ore.Date(15, 1, 2024)
 
     def test_wrap_flat_forward(self, eval_date: ore.Date):
         """Test wrapping a FlatForward curve."""
@@ -76,16 +81,13 @@ class TestQuantLibToOreHandle:
         assert 0.9 < df_1y < 1.0
 
 
-@pytest.mark.skipif(not ORE_AVAILABLE, reason="ORE not installed")
 class TestRelinkableHandle:
     """Tests for quantlib_curve_to_relinkable_handle."""
 
     @pytest.fixture
     def eval_date(self) -> ore.Date:
         """Create evaluation date."""
-        d = ore.Date(15, 1, 2024)
-        ore.Settings.instance().evaluationDate = d
-        return d
+        return ore.Date(15, 1, 2024)
 
     def test_create_empty_handle(self):
         """Test creating an empty relinkable handle."""
@@ -117,16 +119,13 @@ class TestRelinkableHandle:
         assert df_after > df_before
 
 
-@pytest.mark.skipif(not ORE_AVAILABLE, reason="ORE not installed")
 class TestCreateFlatForwardCurve:
     """Tests for create_flat_forward_curve."""
 
     @pytest.fixture
     def eval_date(self) -> ore.Date:
         """Create evaluation date."""
-        d = ore.Date(15, 1, 2024)
-        ore.Settings.instance().evaluationDate = d
-        return d
+        return ore.Date(15, 1, 2024)
 
     def test_create_with_default_daycount(self, eval_date: ore.Date):
         """Test creating flat curve with default day count."""
@@ -154,17 +153,24 @@ class TestCreateFlatForwardCurve:
         df_50y = handle.discount(eval_date + ore.Period(50, ore.Years))
         assert df_50y > 0
 
+    def test_repeated_calls_return_independent_curves(self, eval_date: ore.Date):
+        """Test curves from identical arguments do not share extrapolation state."""
+        first = create_flat_forward_curve(eval_date, 0.05)
+        second = create_flat_forward_curve(eval_date, 0.05)
+
+        first.currentLink().disableExtrapolation()
+
+        assert first is not second
+        assert second.currentLink().allowsExtrapolation()
+
 
-@pytest.mark.skipif(not ORE_AVAILABLE, reason="ORE not installed")
 class TestOreHandleToCurve:
     """Tests for ore_handle_to_curve."""
 
     @pytest.fixture
     def eval_date(self) -> ore.Date:
         """Create evaluation date."""
-        d = ore.Date(15, 1, 2024)
-        ore.Settings.instance().evaluationDate = d
-        return d
+        return ore.Date(15, 1, 2024)
 
     def test_extract_curve_from_handle(self, eval_date: ore.Date):
         """Test extracting curve from a handle."""
@@ -194,16 +200,13 @@ class TestOreHandleToCurve:
         assert curve.maxDate() > eval_date
 
 
-@pytest.mark.skipif(not ORE_AVAILABLE, reason="ORE not installed")
 class TestOreCurveToQuantlib:
     """Tests for ore_curve_to_quantlib."""
 
     @pytest.fixture
     def eval_date(self) -> ore.Date:
         """Create evaluation date."""
-        d = ore.Date(15, 1, 2024)
-        ore.Settings.instance().evaluationDate = d
-        return d
+        return ore.Date(15, 1, 2024)
 
     def test_convert_ore_curve(self, eval_date: ore.Date):
         """Test converting ORE curve to QuantLib."""
@@ -218,16 +221,13 @@ class TestOreCurveToQuantlib:
         assert 0.9 < df < 1.0
 
 
-@pytest.mark.skipif(not ORE_AVAILABLE, reason="ORE not installed")
 class TestGetDiscountFactors:
     """Tests for get_discount_factors."""
 
     @pytest.fixture
     def eval_date(self) -> ore.Date:
         """Create evaluation date."""
-        d = ore.Date(15, 1, 2024)
-        ore.Settings.instance().evaluationDate = d
-        return d
+        return ore.Date(15, 1, 2024)
 
     def test_get_multiple_dfs(self, eval_date: ore.Date):
         """Test getting discount factors for multiple dates."""
@@ -240,6 +240,7 @@ class TestGetDiscountFactors:
 
         dfs = get_discount_factors(handle, dates)
 
+        assert isinstance(dfs, np.ndarray)
         assert len(dfs) == 3
         # DFs should decrease with time
         assert dfs[0] > dfs[1] > dfs[2]
@@ -248,16 +249,13 @@ class TestGetDiscountFactors:
             assert 0 < df < 1
 
 
-@pytest.mark.skipif(not ORE_AVAILABLE, reason="ORE not installed")
 class TestGetZeroRates:
     """Tests for get_zero_rates."""
 
     @pytest.fixture
     def eval_date(self) -> ore.Date:
         """Create evaluation date."""
-        d = ore.Date(15, 1, 2024)
-        ore.Settings.instance().evaluationDate = d
-        return d
+        return ore.Date(15, 1, 2024)
 
     def test_get_multiple_zero_rates(self, eval_date: ore.Date):
         """Test getting zero rates for multiple dates."""
@@ -286,16 +284,82 @@ class TestGetZeroRates:
         assert rates[0] > 0
 
 
-@pytest.mark.skipif(not ORE_AVAILABLE, reason="ORE not installed")
+class TestBatchArrays:
+    """Tests for get_discount_factors_array and get_zero_rates_array."""
+
+    @pytest.fixture
+    def eval_date(self) -> ore.Date:
+        """Create evaluation date."""
+        return ore.Date(15, 1, 2024)
+
+    def test_discount_factors_array_matches_curve(self, eval_date: ore.Date):
+        """Test array DFs match the curve and the get_discount_factors alias."""
+        handle = create_flat_forward_curve(eval_date, 0.05)
+        dates = [eval_date + ore.Period(t, ore.Years) for t in [1, 2, 5, 10]]
+
+        dfs = get_discount_factors_array(handle, dates)
+
+        assert dfs.dtype == np.float64
+        np.testing.assert_allclose(dfs, [handle.discount(d) for d in dates], rtol=1e-14)
+        assert dfs.tolist() == get_discount_factors(handle, dates).tolist()
+
+    def test_zero_rates_array_matches_curve(self, eval_date: ore.Date):
+        """Test array zero rates match the curve and the get_zero_rates alias."""
+        handle = create_flat_forward_curve(eval_date, 0.05)
+        dates = [eval_date + ore.Period(t, ore.Years) for t in [1, 5, 10]]
+
+        rates = get_zero_rates_array(handle, dates, day_count=ore.Actual360())
+
+        assert rates.shape == (3,)
+        assert rates.tolist() == [
+            handle.zeroRate(d, ore.Actual360(), ore.Continuous).rate() for d in dates
+        ]
+        assert rates.tolist() == get_zero_rates(
+            handle, dates, day_count=ore.Actual360()
+        ).tolist()
+
+    def test_empty_dates(self, eval_date: ore.Date):
+        """Test empty date list returns an empty array."""
+        handle = create_flat_forward_curve(eval_date, 0.05)
+
+        assert get_discount_factors_array(handle, []).shape == (0,)
+
+    def test_flat_forward_closed_form_matches_curve(self, eval_date: ore.Date):
+        """Test closed-form flat forward DFs match discount()."""
+        for day_count in (ore.Actual360(), ore.Actual365Fixed()):
+            handle = create_flat_forward_curve(eval_date, 0.0425, day_count)
+            dates = [eval_date + d for d in range(0, 11000, 30)]
+
+            dfs = get_discount_factors_array(handle, dates)
+
+            np.testing.assert_allclose(
+                dfs, [handle.discount(d) for d in dates], rtol=1e-14
+            )
+
+    def test_discount_curve_nodes_match_curve(self, eval_date: ore.Date):
+        """Test node interpolation on a concrete curve matches discount()."""
+        curve = ore.DiscountCurve(
+            [eval_date, eval_date + 365, eval_date + 730, eval_date + 3650],
+            [1.0, 0.97, 0.93, 0.7],
+            ore.Actual365Fixed(),
+        )
+        curve.enableExtrapolation()
+        # Includes node dates, in-between dates and extrapolated dates
+        dates = [eval_date + d for d in range(0, 5000, 7)]
+
+        dfs = get_discount_factors_array(curve, dates)
+
+        expected = [curve.discount(d) for d in dates]
+        np.testing.assert_allclose(dfs, expected, rtol=1e-12)
+
+
 class TestExtractCurvePoints:
     """Tests for extract_curve_points."""
 
     @pytest.fixture
     def eval_date(self) -> ore.Date:
         """Create evaluation date."""
-        d = ore.Date(15, 1, 2024)
-        ore.Settings.instance().evaluationDate = d
-        return d
+        return ore.Date(15, 1, 2024)
 
     def test_extract_default_tenors(self, eval_date: ore.Date):
         """Test extracting curve points with default tenors."""
@@ -319,17 +383,57 @@ class TestExtractCurvePoints:
 
         assert len(points) == 3
 
+    def test_zero_rates_match_curve(self, eval_date: ore.Date):
+        """Test zero rates derived from DFs match the curve's own zero rates."""
+        handle = create_flat_forward_curve(eval_date, 0.05)
+        tenors = ["1M", "1Y", "5Y", "30Y"]
+
+        points = extract_curve_points(handle, tenors=tenors)
+
+        for tenor, (_, _, zr) in zip(tenors, points):
+            target = eval_date + ore.Period(tenor)
+            expected = handle.zeroRate(target, ore.Actual365Fixed(), ore.Continuous).rate()
+            assert abs(zr - expected) < 1e-12
+
+    def test_skips_tenors_beyond_max_date(self, eval_date: ore.Date):
+        """Test tenors past the end of a non-extrapolating curve are skipped."""
+        curve = ore.DiscountCurve(
+            [eval_date, eval_date + ore.Period(5, ore.Years)],
+            [1.0, 0.8],
+            ore.Actual365Fixed(),
+        )
+        handle = ore.YieldTermStructureHandle(curve)
+
+        points = extract_curve_points(handle, tenors=["1Y", "5Y", "10Y"])
+
+        assert len(points) == 2
+
+    def test_skips_points_the_curve_cannot_evaluate(self, eval_date: ore.Date):
+        """Test a RuntimeError from the curve skips that point, not the export."""
+        cutoff = eval_date + ore.Period(3, ore.Years)
+
+        class FailingHandle(ore.YieldTermStructureHandle):
+            def discount(self, d):
+                if d > cutoff:
+                    raise RuntimeError("bootstrap failed")
+                return super().discount(d)
+
+        curve = ore.FlatForward(eval_date, 0.05, ore.Actual365Fixed())
+        curve.enableExtrapolation()
+        handle = FailingHandle(curve)
+
+        points = extract_curve_points(handle, tenors=["1Y", "5Y", "2Y"])
+
+        assert len(points) == 2
+
 
-@pytest.mark.skipif(not ORE_AVAILABLE, reason="ORE not installed")
 class TestCurvePersistenceCSV:
     """Tests for CSV curve persistence."""
 
     @pytest.fixture
     def eval_date(self) -> ore.Date:
         """Create evaluation date."""
-        d = ore.Date(15, 1, 2024)
-        ore.Settings.instance().evaluationDate = d
-        return d
+        return ore.Date(15, 1, 2024)
 
     def test_save_and_load_csv(self, eval_date: ore.Date):
         """Test saving and loading a curve to/from CSV."""
@@ -370,6 +474,71 @@ class TestCurvePersistenceCSV:
         finally:
             csv_path.unlink(missing_ok=True)
 
+    def test_save_csv_with_day_and_compound_tenors(self, eval_date: ore.Date):
+        """Test export tenors are parsed by ORE, so days and compound tenors work."""
+        handle = create_flat_forward_curve(eval_date, 0.05)
+
+        with tempfile.NamedTemporaryFile(suffix=".csv", delete=False) as f:
+            csv_path = Path(f.name)
+
+        try:
+            save_curve_to_csv(handle, csv_path, tenors=["1D", "1Y6M", "2y"])
+
+            content = csv_path.read_text()
+            assert "2024-01-16," in content
+            assert "2025-07-15," in content
+            assert "2026-01-15," in content
+        finally:
+            csv_path.unlink(missing_ok=True)
+
+    @pytest.mark.parametrize("max_workers", [None, 2])
+    def test_save_multiple_curves(self, eval_date: ore.Date, max_workers):
+        """Test saving several curves to a directory in one call."""
+        handles = {
+            "CURVE_A": create_flat_forward_curve(eval_date, 0.05),
+            "CURVE_B": create_flat_forward_curve(eval_date, 0.03),
+        }
+        date_5y = eval_date + ore.Period(5, ore.Years)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = save_curves_to_csv(
+                handles, tmp_dir, tenors=["1Y", "5Y", "10Y"], max_workers=max_workers
+            )
+
+            assert [p.name for p in paths] == ["CURVE_A.csv", "CURVE_B.csv"]
+            for (name, handle), path in zip(handles.items(), paths):
+                assert name in path.read_text()
+                loaded_curve = load_curve_from_csv(path)
+                assert abs(loaded_curve.discount(date_5y) - handle.discount(date_5y)) < 1e-10
+
+    def test_save_and_load_csv_serial_dates(self, eval_date: ore.Date):
+        """Test round-tripping a CSV written with serial-number dates."""
+        original_handle = create_flat_forward_curve(eval_date, 0.05)
+        date_5y = eval_date + ore.Period(5, ore.Years)
+
+        with tempfile.NamedTemporaryFile(suffix=".csv", delete=False) as f:
+            csv_path = Path(f.name)
+
+        try:
+            save_curve_to_csv(
+                original_handle, csv_path, tenors=["1Y", "5Y", "10Y"], format_version=2
+            )
+            content = csv_path.read_text()
+            assert "date_serial" in content
+            assert str(date_5y.serialNumber()) in content
+
+            loaded_curve = load_curve_from_csv(csv_path)
+            assert abs(loaded_curve.discount(date_5y) - original_handle.discount(date_5y)) < 1e-10
+        finally:
+            csv_path.unlink(missing_ok=True)
+
+    def test_unknown_format_version_raises(self, eval_date: ore.Date):
+        """Test that an unsupported format version is rejected."""
+        handle = create_flat_forward_curve(eval_date, 0.05)
+
+        with pytest.raises(ValueError, match="Unknown format_version"):
+            save_curve_to_csv(handle, "unused.csv", format_version=3)
+
     def test_load_csv_with_zero_rates(self, eval_date: ore.Date):
         """Test loading a curve using zero rates instead of discount factors."""
         original_handle = create_flat_forward_curve(eval_date, 0.05)
@@ -389,16 +558,13 @@ class TestCurvePersistenceCSV:
             csv_path.unlink(missing_ok=True)
 
 
-@pytest.mark.skipif(not ORE_AVAILABLE, reason="ORE not installed")
 class TestCurvePersistenceJSON:
     """Tests for JSON curve persistence."""
 
     @pytest.fixture
     def eval_date(self) -> ore.Date:
         """Create evaluation date."""
-        d = ore.Date(15, 1, 2024)
-        ore.Settings.instance().evaluationDate = d
-        return d
+        return ore.Date(15, 1, 2024)
 
     def test_save_and_load_json(self, eval_date: ore.Date):
         """Test saving and loading a curve to/from JSON."""
@@ -422,7 +588,10 @@ class TestCurvePersistenceJSON:
             with open(json_path) as f:
                 data = json.load(f)
             assert data["curve_name"] == "TEST_CURVE"
-            assert len(data["points"]) == 3
+            assert data["schema_version"] == 2
+            assert len(data["dates"]) == 3
+            assert len(data["discount_factors"]) == 3
+            assert len(data["zero_rates"]) == 3
 
             # Load (returns QuantLib curve, not handle)
             loaded_curve = load_curve_from_json(json_path)
@@ -441,6 +610,29 @@ class TestCurvePersistenceJSON:
         finally:
             json_path.unlink(missing_ok=True)
 
+    def test_save_and_load_json_serial_dates(self, eval_date: ore.Date):
+        """Test round-tripping a JSON file written with serial-number dates."""
+        original_handle = create_flat_forward_curve(eval_date, 0.05)
+        date_5y = eval_date + ore.Period(5, ore.Years)
+
+        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
+            json_path = Path(f.name)
+
+        try:
+            save_curve_to_json(
+                original_handle, json_path, tenors=["1Y", "5Y", "10Y"], format_version=2
+            )
+            import json
+            with open(json_path) as f:
+                data = json.load(f)
+            assert data["schema_version"] == 3
+            assert data["date_serials"][1] == date_5y.serialNumber()
+
+            loaded_curve = load_curve_from_json(json_path)
+            assert abs(loaded_curve.discount(date_5y) - original_handle.discount(date_5y)) < 1e-10
+        finally:
+            json_path.unlink(missing_ok=True)
+
     def test_load_json_with_zero_rates(self, eval_date: ore.Date):
         """Test loading a curve using zero rates instead of discount factors."""
         original_handle = create_flat_forward_curve(eval_date, 0.05)
@@ -458,3 +650,81 @@ class TestCurvePersistenceJSON:
             assert 0 < df < 1
         finally:
             json_path.unlink(missing_ok=True)
+
+    def test_load_unknown_schema_version_raises(self):
+        """Test a JSON file with an unknown schema_version is rejected."""
+        import json
+
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+            json.dump({"schema_version": 99, "reference_date": "2024-01-15"}, f)
+            json_path = Path(f.name)
+
+        try:
+            with pytest.raises(ValueError, match="Unknown JSON schema_version"):
+                load_curve_from_json(json_path)
+        finally:
+            json_path.unlink(missing_ok=True)
+
+    def test_load_legacy_points_layout(self, eval_date: ore.Date):
+        """Test loading a JSON file written with the per-point layout."""
+        import json
+
+        original_handle = create_flat_forward_curve(eval_date, 0.05)
+        date_5y = eval_date + ore.Period(5, ore.Years)
+        data = {
+            "curve_name": "LEGACY",
+            "reference_date": "2024-01-15",
+            "points": [
+                {"date": "2025-01-15", "discount_factor": 0.95, "zero_rate": 0.05},
+                {
+                    "date": "2029-01-15",
+                    "discount_factor": original_handle.discount(date_5y),
+                    "zero_rate": 0.05,
+                },
+            ],
+        }
+
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".json", delete=False
+        ) as f:
+            json.dump(data, f)
+            json_path = Path(f.name)
+
+        try:
+            loaded_curve = load_curve_from_json(json_path)
+            assert abs(loaded_curve.discount(date_5y) - original_handle.discount(date_5y)) < 1e-10
+        finally:
+            json_path.unlink(missing_ok=True)
+
+
+class TestCurvePersistenceParquet:
+    """Tests for Parquet curve persistence."""
+
+    @pytest.fixture
+    def eval_date(self) -> ore.Date:
+        """Create evaluation date."""
+        return ore.Date(15, 1, 2024)
+
+    def test_save_and_load_parquet(self, eval_date: ore.Date):
+        """Test saving and loading a curve to/from Parquet."""
+        pytest.importorskip("pyarrow")
+        original_handle = create_flat_forward_curve(eval_date, 0.05)
+
+        with tempfile.NamedTemporaryFile(suffix=".parquet", delete=False) as f:
+            parquet_path = Path(f.name)
+
+        try:
+            save_curve_to_parquet(
+                original_handle,
+                parquet_path,
+                tenors=["1Y", "5Y", "10Y"],
+                curve_name="TEST_CURVE",
+            )
+            loaded_curve = load_curve_from_parquet(parquet_path)
+
+            assert loaded_curve.referenceDate() == eval_date
+            for years in [1, 5]:
+                target = eval_date + ore.Period(years, ore.Years)
+                assert abs(original_handle.discount(target) - loaded_curve.discount(target)) < 1e-10
+        finally:
+            parquet_path.unlink(missing_ok=True)
@@ -1,7 +1,8 @@
 """Tests for curve builder module."""
 
+import io
 from datetime import date, timedelta
-from typing import List, Tuple
+from typing import Sequence, Tuple
 
 import pytest
 
@@ -18,6 +19,7 @@ try:
         XCCYCurveBuilder,
         build_xccy_curve,
     )
+    from ore_xccy_curve.main import EUR_OIS_RATES, GBP_OIS_RATES, USD_OIS_RATES
 
     ORE_AVAILABLE = True
 except ImportError:
@@ -25,45 +27,44 @@ except ImportError:
     ore = None
     XCCYCurveBuilder = None
 
+pytestmark = pytest.mark.skipif(not ORE_AVAILABLE, reason="ORE not installed")
 
-# Dummy OIS rates for testing (these would come from external sources in production)
-def get_dummy_usd_ois_rates() -> List[Tuple[str, float]]:
+
+# Dummy OIS rates for testing; USD, GBP and EUR are shared with the demo in main
+JPY_OIS_RATES: Tuple[Tuple[str, float], ...] = (
+    ("1M", -0.001), ("3M", -0.001), ("6M", 0.000), ("1Y", 0.002),
+    ("2Y", 0.005), ("3Y", 0.008), ("5Y", 0.012), ("7Y", 0.015),
+    ("10Y", 0.018), ("15Y", 0.020), ("20Y", 0.022), ("30Y", 0.024),
+)
+
+
+def get_dummy_usd_ois_rates() -> Sequence[Tuple[str, float]]:
     """Get dummy USD SOFR OIS rates for testing."""
-    return [
-        ("1M", 0.0525), ("3M", 0.0530), ("6M", 0.0528), ("1Y", 0.0510),
-        ("2Y", 0.0465), ("3Y", 0.0430), ("5Y", 0.0395), ("7Y", 0.0385),
-        ("10Y", 0.0380), ("15Y", 0.0385), ("20Y", 0.0390), ("30Y", 0.0395),
-    ]
+    return USD_OIS_RATES
 
 
-def get_dummy_gbp_ois_rates() -> List[Tuple[str, float]]:
+def get_dummy_gbp_ois_rates() -> Sequence[Tuple[str, float]]:
     """Get dummy GBP SONIA OIS rates for testing."""
-    return [
-        ("1M", 0.0515), ("3M", 0.0520), ("6M", 0.0510), ("1Y", 0.0485),
-        ("2Y", 0.0440), ("3Y", 0.0405), ("5Y", 0.0375), ("7Y", 0.0365),
-        ("10Y", 0.0360), ("15Y", 0.0365), ("20Y", 0.0370), ("30Y", 0.0375),
-    ]
+    return GBP_OIS_RATES
 
 
-def get_dummy_eur_ois_rates() -> List[Tuple[str, float]]:
+def get_dummy_eur_ois_rates() -> Sequence[Tuple[str, float]]:
     """Get dummy EUR ESTR OIS rates for testing."""
-    return [
-        ("1M", 0.0390), ("3M", 0.0395), ("6M", 0.0388), ("1Y", 0.0365),
-        ("2Y", 0.0320), ("3Y", 0.0290), ("5Y", 0.0265), ("7Y", 0.0260),
-        ("10Y", 0.0258), ("15Y", 0.0265), ("20Y", 0.0270), ("30Y", 0.0275),
-    ]
+    return EUR_OIS_RATES
 
 
-def get_dummy_jpy_ois_rates() -> List[Tuple[str, float]]:
+def get_dummy_jpy_ois_rates() -> Sequence[Tuple[str, float]]:
     """Get dummy JPY TONAR OIS rates for testing."""
-    return [
-        ("1M", -0.001), ("3M", -0.001), ("6M", 0.000), ("1Y", 0.002),
-        ("2Y", 0.005), ("3Y", 0.008), ("5Y", 0.012), ("7Y", 0.015),
-        ("10Y", 0.018), ("15Y", 0.020), ("20Y", 0.022), ("30Y", 0.024),
-    ]
+    return JPY_OIS_RATES
+
+
+@pytest.fixture(scope="module")
+def usd_ois_curve() -> ore.YieldTermStructureHandle:
+    """Bootstrap the USD OIS curve shared by every currency pair in this module."""
+    config = MarketDataFactory.CURRENCY_CONFIGS["USD"]
+    return OISCurveBuilder(ore.Date(15, 1, 2024), config, get_dummy_usd_ois_rates()).build()
 
 
-@pytest.mark.skipif(not ORE_AVAILABLE, reason="ORE not installed")
 class TestOISIndexFactory:
     """Tests for OISIndexFactory."""
 
@@ -82,8 +83,17 @@ class TestOISIndexFactory:
         with pytest.raises(ValueError, match="Unknown OIS index"):
             OISIndexFactory.create("UNKNOWN")
 
+    def test_create_reuses_instance(self):
+        """Test repeated creation with the same handle reuses the index."""
+        assert OISIndexFactory.create("SOFR") is OISIndexFactory.create("SOFR")
+
+    def test_create_with_handle_not_cached(self, usd_ois_curve):
+        """Test indices on a caller's curve are built fresh, not cached."""
+        index = OISIndexFactory.create("SOFR", usd_ois_curve)
+        assert index is not OISIndexFactory.create("SOFR", usd_ois_curve)
+        assert OISIndexFactory._CACHE.get("SOFR") is not index
+
 
-@pytest.mark.skipif(not ORE_AVAILABLE, reason="ORE not installed")
 class TestCalendarFactory:
     """Tests for CalendarFactory."""
 
@@ -102,8 +112,18 @@ class TestCalendarFactory:
         with pytest.raises(ValueError, match="Unknown calendar"):
             CalendarFactory.create("UNKNOWN")
 
+    def test_create_reuses_instance(self):
+        """Test repeated creation returns the cached calendar."""
+        assert CalendarFactory.create("TARGET") is CalendarFactory.create("TARGET")
+
+    def test_create_joint_calendar(self):
+        """Test creating a cached joint calendar."""
+        joint = CalendarFactory.create_joint("US-FederalReserve", "UK-Exchange")
+        assert joint is CalendarFactory.create_joint("US-FederalReserve", "UK-Exchange")
+        # July 4th is a US-only holiday, so not a joint business day
+        assert not joint.isBusinessDay(ore.Date(4, 7, 2024))
+
 
-@pytest.mark.skipif(not ORE_AVAILABLE, reason="ORE not installed")
 class TestDayCountFactory:
     """Tests for DayCountFactory."""
 
@@ -122,17 +142,18 @@ class TestDayCountFactory:
         with pytest.raises(ValueError, match="Unknown day count"):
             DayCountFactory.create("UNKNOWN")
 
+    def test_create_reuses_instance(self):
+        """Test repeated creation returns the cached day counter."""
+        assert DayCountFactory.create("Actual360") is DayCountFactory.create("Actual360")
+
 
-@pytest.mark.skipif(not ORE_AVAILABLE, reason="ORE not installed")
 class TestOISCurveBuilder:
     """Tests for OISCurveBuilder class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def eval_date(self) -> ore.Date:
         """Create evaluation date."""
-        d = ore.Date(15, 1, 2024)
-        ore.Settings.instance().evaluationDate = d
-        return d
+        return ore.Date(15, 1, 2024)
 
     def test_build_usd_curve(self, eval_date: ore.Date):
         """Test building USD OIS curve."""
@@ -157,27 +178,42 @@ class TestOISCurveBuilder:
 
         assert curve is not None
 
+    def test_build_on_other_eval_date(self, eval_date: ore.Date, with_eval_date):
+        """Test building under a temporary evaluation date restores the original."""
+        config = MarketDataFactory.CURRENCY_CONFIGS["USD"]
+        other_date = ore.Date(1, 7, 2024)
+
+        with with_eval_date(other_date):
+            curve = OISCurveBuilder(other_date, config, get_dummy_usd_ois_rates()).build()
+            assert curve.referenceDate() == other_date
+
+        assert ore.Settings.instance().evaluationDate == eval_date
+
+    def test_unknown_tenor_raises(self, eval_date: ore.Date):
+        """Test an unparseable tenor string raises error."""
+        config = MarketDataFactory.CURRENCY_CONFIGS["USD"]
+        rates = [("1M", 0.0525), ("3D", 0.0530)]
+
+        builder = OISCurveBuilder(eval_date, config, rates)
+        with pytest.raises(ValueError, match="Unknown tenor format"):
+            builder.build()
+
 
-@pytest.mark.skipif(not ORE_AVAILABLE, reason="ORE not installed")
 class TestXCCYCurveBuilder:
     """Tests for XCCYCurveBuilder class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def market_data(self) -> XCCYMarketData:
         """Create test market data."""
         return MarketDataFactory.create_gbpusd()
 
-    @pytest.fixture
-    def curves(self, market_data: XCCYMarketData) -> dict:
+    @pytest.fixture(scope="module")
+    def curves(self, market_data: XCCYMarketData, usd_ois_curve) -> dict:
         """Build all curves including the input OIS curves."""
         val_date = market_data.valuation_date
         eval_date = ore.Date(val_date.day, val_date.month, val_date.year)
-        ore.Settings.instance().evaluationDate = eval_date
 
         # Build input curves (simulating external curve loading)
-        usd_curve = OISCurveBuilder(
-            eval_date, market_data.domestic_ccy, get_dummy_usd_ois_rates()
-        ).build()
         gbp_curve = OISCurveBuilder(
             eval_date, market_data.foreign_ccy, get_dummy_gbp_ois_rates()
         ).build()
@@ -185,16 +221,42 @@ class TestXCCYCurveBuilder:
         # Build XCCY curve
         return build_xccy_curve(
             market_data,
-            domestic_discount_curve=usd_curve,
-            domestic_index_curve=usd_curve,
+            domestic_discount_curve=usd_ois_curve,
+            domestic_index_curve=usd_ois_curve,
             foreign_index_curve=gbp_curve,
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def xccy_builder(self, curves: dict) -> XCCYCurveBuilder:
         """Get XCCY builder from curves."""
         return curves["xccy_builder"]
 
+    @pytest.fixture(scope="module")
+    def pillars(self, market_data: XCCYMarketData) -> dict:
+        """Named test dates as (Python date, ore.Date) pairs, built once."""
+        val_date = market_data.valuation_date
+        result = {}
+        for name, days in (("3M", 90), ("1Y", 365), ("5Y", 365 * 5)):
+            d = val_date + timedelta(days=days)
+            result[name] = (d, ore.Date(d.day, d.month, d.year))
+        return result
+
+    @pytest.fixture
+    def unbuilt_builder(self, curves: dict) -> XCCYCurveBuilder:
+        """Create a fresh XCCY builder over the shared input curves."""
+        return XCCYCurveBuilder(
+            MarketDataFactory.create_gbpusd(),
+            domestic_discount_curve=curves["domestic_discount"],
+            domestic_index_curve=curves["domestic_index"],
+            foreign_index_curve=curves["foreign_index"],
+        )
+
+    @pytest.fixture
+    def own_builder(self, unbuilt_builder: XCCYCurveBuilder) -> XCCYCurveBuilder:
+        """Build a private XCCY builder for tests that bump its quotes."""
+        unbuilt_builder.build()
+        return unbuilt_builder
+
     def test_build_xccy_curve(self, curves: dict):
         """Test building all curves via convenience function."""
         assert "domestic_discount" in curves
@@ -217,60 +279,64 @@ class TestXCCYCurveBuilder:
         """Test that XCCY curve is built."""
         assert xccy_builder.foreign_xccy_curve is not None
 
-    def test_get_discount_factor(self, xccy_builder: XCCYCurveBuilder):
+    def test_get_discount_factor(self, xccy_builder: XCCYCurveBuilder, pillars: dict):
         """Test getting discount factor from XCCY curve."""
-        val_date = xccy_builder.market_data.valuation_date
-        future_date = val_date + timedelta(days=365)
+        future_date, _ = pillars["1Y"]
 
         df = xccy_builder.get_discount_factor(future_date)
         assert 0.9 < df < 1.0
 
-    def test_get_discount_factor_without_build_raises(self, market_data: XCCYMarketData):
+    def test_get_discount_factor_without_build_raises(
+        self, unbuilt_builder: XCCYCurveBuilder
+    ):
         """Test getting discount factor before building raises error."""
-        val_date = market_data.valuation_date
-        eval_date = ore.Date(val_date.day, val_date.month, val_date.year)
-        ore.Settings.instance().evaluationDate = eval_date
-
-        # Build input curves
-        usd_curve = OISCurveBuilder(
-            eval_date, market_data.domestic_ccy, get_dummy_usd_ois_rates()
-        ).build()
-        gbp_curve = OISCurveBuilder(
-            eval_date, market_data.foreign_ccy, get_dummy_gbp_ois_rates()
-        ).build()
-
-        # Create builder without calling build()
-        builder = XCCYCurveBuilder(
-            market_data,
-            domestic_discount_curve=usd_curve,
-            domestic_index_curve=usd_curve,
-            foreign_index_curve=gbp_curve,
-        )
+        val_date = unbuilt_builder.market_data.valuation_date
 
         with pytest.raises(ValueError, match="not built"):
-            builder.get_discount_factor(val_date + timedelta(days=90))
+            unbuilt_builder.get_discount_factor(val_date + timedelta(days=90))
 
-    def test_get_zero_rate(self, xccy_builder: XCCYCurveBuilder):
+    def test_get_zero_rate(self, xccy_builder: XCCYCurveBuilder, pillars: dict):
         """Test getting zero rate from XCCY curve."""
-        val_date = xccy_builder.market_data.valuation_date
-        future_date = val_date + timedelta(days=365)
+        future_date, _ = pillars["1Y"]
 
         zero_rate = xccy_builder.get_zero_rate(future_date)
         assert 0 < zero_rate < 0.10
 
-    def test_get_implied_fx_forward(self, xccy_builder: XCCYCurveBuilder):
-        """Test calculating implied FX forward."""
+    @pytest.mark.parametrize("compounding", ["continuous", "annual"])
+    def test_get_zero_rates_matches_scalar(
+        self, xccy_builder: XCCYCurveBuilder, compounding: str
+    ):
+        """Test batch zero rates match the per-date zero rate."""
         val_date = xccy_builder.market_data.valuation_date
-        fwd_3m = xccy_builder.get_implied_fx_forward(val_date + timedelta(days=90))
+        target_dates = [val_date + timedelta(days=d) for d in [0, 30, 365, 365 * 10]]
+
+        rates = xccy_builder.get_zero_rates(target_dates, compounding)
+
+        expected = [xccy_builder.get_zero_rate(d, compounding) for d in target_dates]
+        assert rates == pytest.approx(expected, rel=1e-10)
+
+    def test_get_implied_fx_forward(self, xccy_builder: XCCYCurveBuilder, pillars: dict):
+        """Test calculating implied FX forward."""
+        fwd_3m = xccy_builder.get_implied_fx_forward(pillars["3M"][0])
 
         spot = xccy_builder.market_data.fx_spot
         assert abs(fwd_3m - spot) / spot < 0.05
 
-    def test_xccy_curve_reflects_basis(self, curves: dict, xccy_builder: XCCYCurveBuilder):
-        """Test that XCCY curve reflects the basis adjustment."""
+    def test_get_implied_fx_forwards_matches_scalar(self, xccy_builder: XCCYCurveBuilder):
+        """Test batch implied FX forwards match the per-date calculation."""
         val_date = xccy_builder.market_data.valuation_date
-        target_date = val_date + timedelta(days=365 * 5)
-        ore_date = ore.Date(target_date.day, target_date.month, target_date.year)
+        fwd_dates = [val_date + timedelta(days=d) for d in [90, 365, 365 * 5]]
+
+        fwds = xccy_builder.get_implied_fx_forwards(fwd_dates)
+
+        expected = [xccy_builder.get_implied_fx_forward(d) for d in fwd_dates]
+        assert fwds == pytest.approx(expected, rel=1e-12)
+
+    def test_xccy_curve_reflects_basis(
+        self, curves: dict, xccy_builder: XCCYCurveBuilder, pillars: dict
+    ):
+        """Test that XCCY curve reflects the basis adjustment."""
+        target_date, ore_date = pillars["5Y"]
 
         df_foreign_idx = curves["foreign_index"].discount(ore_date)
         df_xccy = xccy_builder.get_discount_factor(target_date)
@@ -279,83 +345,112 @@ class TestXCCYCurveBuilder:
         assert abs(df_xccy - df_foreign_idx) > 0.001
 
     def test_print_curve_summary(self, xccy_builder: XCCYCurveBuilder, capsys):
-        """Test print_curve_summary outputs data."""
-        xccy_builder.print_curve_summary()
-
-        captured = capsys.readouterr()
-        assert "GBPUSD XCCY Basis Curve Summary" in captured.out
-        assert "USD DF" in captured.out
-        assert "GBP DF" in captured.out
-        assert "XCCY DF" in captured.out
-
+        """Test print_curve_summary writes only to the given stream."""
+        buf = io.StringIO()
+        xccy_builder.print_curve_summary(file=buf)
+
+        assert capsys.readouterr().out == ""
+        captured = buf.getvalue()
+        assert "GBPUSD XCCY Basis Curve Summary" in captured
+        assert "USD DF" in captured
+        assert "GBP DF" in captured
+        assert "XCCY DF" in captured
+
+    def test_helper_quotes_exposed(self, own_builder: XCCYCurveBuilder):
+        """Test helper quotes are kept and drive the bootstrapped curve."""
+        market_data = own_builder.market_data
+        assert len(own_builder._fwd_quotes) == len(market_data.fx_forwards)
+        assert len(own_builder._basis_quotes) == len(market_data.xccy_basis_swaps)
+
+        target_date = market_data.valuation_date + timedelta(days=365 * 5)
+        df_before = own_builder.get_discount_factor(target_date)
+
+        quote = own_builder._basis_quotes[0]
+        quote.setValue(quote.value() + 0.0010)
+
+        assert own_builder.get_discount_factor(target_date) != df_before
+
+    def test_rebuild_matches_fresh_build(self, curves: dict, own_builder: XCCYCurveBuilder):
+        """Test rebuild with bumped spreads matches building from bumped data."""
+        market_data = own_builder.market_data
+        bumped = [s.basis_spread + 1.0 for s in market_data.xccy_basis_swaps]
+
+        handle = own_builder.rebuild(new_spreads=bumped)
+
+        bumped_data = MarketDataFactory.create_gbpusd()
+        for swap, spread in zip(bumped_data.xccy_basis_swaps, bumped):
+            swap.basis_spread = spread
+        fresh = XCCYCurveBuilder(
+            bumped_data,
+            domestic_discount_curve=curves["domestic_discount"],
+            domestic_index_curve=curves["domestic_index"],
+            foreign_index_curve=curves["foreign_index"],
+        ).build()
 
-@pytest.mark.skipif(not ORE_AVAILABLE, reason="ORE not installed")
-class TestXCCYCurveBuilderMultiplePairs:
-    """Tests for XCCYCurveBuilder with multiple currency pairs."""
+        target = own_builder.eval_date + ore.Period(10, ore.Years)
+        assert handle.discount(target) == pytest.approx(fresh.discount(target), abs=1e-12)
 
-    @pytest.fixture
-    def eval_date(self) -> ore.Date:
-        """Create evaluation date."""
-        d = ore.Date(15, 1, 2024)
-        ore.Settings.instance().evaluationDate = d
-        return d
+    def test_discounts_batch_matches_discount_factor(self, xccy_builder: XCCYCurveBuilder):
+        """Test batch DFs match per-date discount factors."""
+        val_date = xccy_builder.market_data.valuation_date
+        target_dates = [val_date + timedelta(days=d) for d in range(0, 365 * 40, 45)]
 
-    @pytest.fixture
-    def usd_curve(self, eval_date: ore.Date) -> ore.YieldTermStructureHandle:
-        """Build USD OIS curve."""
-        config = MarketDataFactory.CURRENCY_CONFIGS["USD"]
-        return OISCurveBuilder(eval_date, config, get_dummy_usd_ois_rates()).build()
+        dfs = xccy_builder.discounts_batch(target_dates)
 
-    def test_build_eurusd_curves(self, eval_date: ore.Date, usd_curve):
-        """Test building EURUSD curves."""
-        market_data = MarketDataFactory.create_eurusd()
+        expected = [xccy_builder.get_discount_factor(d) for d in target_dates]
+        assert dfs == pytest.approx(expected, rel=1e-12)
 
-        eur_curve = OISCurveBuilder(
-            eval_date, market_data.foreign_ccy, get_dummy_eur_ois_rates()
-        ).build()
+    def test_rebuild_wrong_length_raises(self, xccy_builder: XCCYCurveBuilder):
+        """Test rebuild with the wrong number of quotes raises error."""
+        with pytest.raises(ValueError, match="forward points"):
+            xccy_builder.rebuild(new_fwds=[1.0])
 
-        result = build_xccy_curve(
-            market_data,
-            domestic_discount_curve=usd_curve,
-            domestic_index_curve=usd_curve,
-            foreign_index_curve=eur_curve,
-        )
 
-        xccy_builder = result["xccy_builder"]
-        assert xccy_builder.ccy_pair == "EURUSD"
-        assert xccy_builder.domestic_ccy == "USD"
-        assert xccy_builder.foreign_ccy == "EUR"
-        assert xccy_builder.foreign_xccy_curve is not None
+class TestXCCYCurveBuilderMultiplePairs:
+    """Tests for XCCYCurveBuilder with multiple currency pairs."""
 
-    def test_build_usdjpy_curves(self, eval_date: ore.Date):
-        """Test building USDJPY curves.
+    @pytest.fixture(scope="module")
+    def eval_date(self) -> ore.Date:
+        """Create evaluation date."""
+        return ore.Date(15, 1, 2024)
+
+    @pytest.fixture(scope="module")
+    def usd_curve(self, usd_ois_curve) -> ore.YieldTermStructureHandle:
+        """Get the shared USD OIS curve."""
+        return usd_ois_curve
+
+    @pytest.mark.parametrize(
+        "factory,rates_fn,ccy_pair,foreign,fx_base_domestic",
+        [
+            (MarketDataFactory.create_eurusd, get_dummy_eur_ois_rates, "EURUSD", "EUR", False),
+            # USDJPY: the FX base currency (USD) equals the collateral, unlike
+            # GBPUSD/EURUSD where the FX base is the foreign currency.
+            (MarketDataFactory.create_usdjpy, get_dummy_jpy_ois_rates, "USDJPY", "JPY", True),
+        ],
+        ids=["EURUSD", "USDJPY"],
+    )
+    def test_build_pair(
+        self, eval_date, usd_curve, factory, rates_fn, ccy_pair, foreign, fx_base_domestic
+    ):
+        """Test building XCCY curves for a USD-collateralised non-GBP pair.
 
-        For USDJPY, USD is still the domestic (collateral) currency.
-        JPY is foreign. This builds a JPY XCCY curve collateralized in USD.
-        The FX base currency (USD) equals the collateral, which differs from
-        GBPUSD where the FX base (GBP) is not the collateral.
+        USD is the domestic (collateral) currency for every pair, so the
+        module-scoped USD curve is shared and only the foreign curves are built.
         """
-        market_data = MarketDataFactory.create_usdjpy()
-
-        # USD is domestic (collateral), JPY is foreign
-        usd_curve = OISCurveBuilder(
-            eval_date, market_data.domestic_ccy, get_dummy_usd_ois_rates()
+        market_data = factory()
+        foreign_curve = OISCurveBuilder(
+            eval_date, market_data.foreign_ccy, rates_fn()
         ).build()
-        jpy_curve = OISCurveBuilder(
-            eval_date, market_data.foreign_ccy, get_dummy_jpy_ois_rates()
-        ).build()
-
         result = build_xccy_curve(
             market_data,
             domestic_discount_curve=usd_curve,
             domestic_index_curve=usd_curve,
-            foreign_index_curve=jpy_curve,
+            foreign_index_curve=foreign_curve,
         )
 
         xccy_builder = result["xccy_builder"]
-        assert xccy_builder.ccy_pair == "USDJPY"
+        assert xccy_builder.ccy_pair == ccy_pair
         assert xccy_builder.domestic_ccy == "USD"
-        assert xccy_builder.foreign_ccy == "JPY"
+        assert xccy_builder.foreign_ccy == foreign
         assert xccy_builder.foreign_xccy_curve is not None
-        # Verify FX base equals collateral for USDJPY
-        assert market_data.is_fx_base_domestic is True
+        assert xccy_builder.market_data.is_fx_base_domestic is fx_base_domestic
@@ -1,5 +1,7 @@
 """Tests for market data module."""
 
+import copy
+import io
 from datetime import date
 
 import pytest
@@ -49,6 +51,12 @@ class TestCurrencyConfig:
         assert config.calendar_name == "US-FederalReserve"
         assert config.day_count == "Actual360"
 
+    def test_shared_config_is_immutable(self):
+        """Test factory currency configs cannot be modified in place."""
+        config = MarketDataFactory.CURRENCY_CONFIGS["USD"]
+        with pytest.raises(AttributeError):
+            config.day_count = "Actual365Fixed"
+
 
 class TestXCCYMarketData:
     """Tests for XCCYMarketData class."""
@@ -65,17 +73,6 @@ class TestXCCYMarketData:
         assert len(gbpusd_data.fx_forwards) == 8
         assert len(gbpusd_data.xccy_basis_swaps) == 9
 
-    def test_ccy_pair_property(self, gbpusd_data: XCCYMarketData):
-        """Test ccy_pair property."""
-        assert gbpusd_data.ccy_pair == "GBPUSD"
-
-    def test_domestic_foreign_currencies(self, gbpusd_data: XCCYMarketData):
-        """Test domestic and foreign currency configs."""
-        assert gbpusd_data.domestic_ccy.ccy == "USD"
-        assert gbpusd_data.domestic_ccy.ois_index_name == "SOFR"
-        assert gbpusd_data.foreign_ccy.ccy == "GBP"
-        assert gbpusd_data.foreign_ccy.ois_index_name == "SONIA"
-
     def test_create_custom_date(self):
         """Test creating data with custom valuation date."""
         custom_date = date(2024, 6, 15)
@@ -103,6 +100,97 @@ class TestXCCYMarketData:
         with pytest.raises(ValueError, match="Unknown tenor"):
             gbpusd_data.get_basis_spread_bps("1M")
 
+    def test_batch_lookups_match_scalar(self, gbpusd_data: XCCYMarketData):
+        """Test batch forward rate and spread lookups match per-tenor calls."""
+        tenors = ["1M", "3M", "1Y"]
+        rates = gbpusd_data.get_forward_rates(tenors)
+        assert rates.tolist() == [gbpusd_data.get_forward_rate(t) for t in tenors]
+
+        spreads = gbpusd_data.get_basis_spreads(["2Y", "10Y"])
+        assert spreads.tolist() == [-12.5, -17.0]
+
+        with pytest.raises(ValueError, match="Unknown tenor"):
+            gbpusd_data.get_basis_spreads(["2Y", "1M"])
+
+    def test_as_arrays(self, gbpusd_data: XCCYMarketData):
+        """Test quotes are exposed as parallel arrays."""
+        fwd_points, fwd_years, basis_bps, swap_years = gbpusd_data.as_arrays()
+
+        assert fwd_points.tolist() == [f.forward_points for f in gbpusd_data.fx_forwards]
+        assert basis_bps.tolist() == [s.basis_spread for s in gbpusd_data.xccy_basis_swaps]
+        assert fwd_years[2] == pytest.approx(1.0 / 12.0)  # 1M
+        assert swap_years.tolist() == [2, 3, 4, 5, 7, 10, 15, 20, 30]
+
+    def test_as_arrays_rejects_bad_tenor(self, gbpusd_data: XCCYMarketData):
+        """Test tenors are validated by the shared tenor parser."""
+        gbpusd_data.fx_forwards.append(FXForwardQuote("-1Y", -5.0))
+
+        with pytest.raises(ValueError, match="Unknown tenor format"):
+            gbpusd_data.as_arrays()
+
+    def test_to_array_tuple(self, gbpusd_data: XCCYMarketData):
+        """Test NamedTuple view carries scalars and quote arrays."""
+        arrays = gbpusd_data.to_array_tuple()
+
+        assert arrays.valuation_ordinal == date(2024, 1, 15).toordinal()
+        assert arrays.fx_spot == 1.2750
+        assert arrays.basis_bps.tolist() == [s.basis_spread for s in gbpusd_data.xccy_basis_swaps]
+
+    def test_lookups_see_quote_updates(self, gbpusd_data: XCCYMarketData):
+        """Test tenor lookups reflect quotes changed or added after creation."""
+        gbpusd_data.xccy_basis_swaps[0].basis_spread = -20.0
+        gbpusd_data.fx_forwards.append(FXForwardQuote("18M", -230.0))
+
+        assert gbpusd_data.get_basis_spread_bps("2Y") == -20.0
+        assert gbpusd_data.get_forward_rate("18M") == pytest.approx(1.2750 - 0.0230)
+
+    def test_lookups_after_replacing_quote_list(self, gbpusd_data: XCCYMarketData):
+        """Test lookups use a quote list assigned after earlier lookups."""
+        assert gbpusd_data.get_forward_rate("1M") == pytest.approx(1.2750 - 0.0012)
+
+        gbpusd_data.fx_forwards = [FXForwardQuote("1M", -24.0)]
+
+        assert gbpusd_data.get_forward_rate("1M") == pytest.approx(1.2750 - 0.0024)
+        with pytest.raises(ValueError, match="Unknown tenor"):
+            gbpusd_data.get_forward_rate("3M")
+
+    def test_deepcopy_lookups_follow_copy(self, gbpusd_data: XCCYMarketData):
+        """Test a deep copy's lookups see edits to the copy, not the original."""
+        gbpusd_data.get_basis_spread_bps("5Y")
+        clone = copy.deepcopy(gbpusd_data)
+
+        clone.xccy_basis_swaps[3] = XCCYBasisSwapQuote("5Y", -30.0)
+
+        assert clone.get_basis_spread_bps("5Y") == -30.0
+        assert gbpusd_data.get_basis_spread_bps("5Y") == -17.5
+
+    def test_lookups_after_swapping_and_popping_quotes(self, gbpusd_data: XCCYMarketData):
+        """Test lookups reflect list entries replaced, reordered or removed."""
+        assert gbpusd_data.get_basis_spread_bps("5Y") == -17.5
+        assert gbpusd_data.get_basis_spread_bps("30Y") == -10.0
+
+        swaps = gbpusd_data.xccy_basis_swaps
+        swaps[3] = XCCYBasisSwapQuote("5Y", -30.0)
+        swaps[0], swaps[1] = swaps[1], swaps[0]
+        swaps.pop()
+
+        assert gbpusd_data.get_basis_spread_bps("5Y") == -30.0
+        assert gbpusd_data.get_basis_spread_bps("2Y") == -12.5
+        assert gbpusd_data.get_basis_spread_bps("3Y") == -15.0
+        with pytest.raises(ValueError, match="Unknown tenor"):
+            gbpusd_data.get_basis_spread_bps("30Y")
+
+    def test_lookups_return_first_listed_duplicate(self, gbpusd_data: XCCYMarketData):
+        """Test a replaced quote duplicating a later tenor is the one returned."""
+        second = gbpusd_data.fx_forwards[1]
+        assert gbpusd_data.get_forward_rate(second.tenor) == pytest.approx(
+            1.2750 + second.forward_points / 10000.0
+        )
+
+        gbpusd_data.fx_forwards[0] = FXForwardQuote(second.tenor, 999.0)
+
+        assert gbpusd_data.get_forward_rate(second.tenor) == pytest.approx(1.2750 + 0.0999)
+
     def test_fx_forwards_have_negative_points(self, gbpusd_data: XCCYMarketData):
         """Test that GBPUSD FX forwards have negative points."""
         for fwd in gbpusd_data.fx_forwards:
@@ -114,54 +202,66 @@ class TestXCCYMarketData:
             assert swap.basis_spread < 0, f"Expected negative spread for {swap.tenor}"
 
     def test_print_summary(self, gbpusd_data: XCCYMarketData, capsys):
-        """Test print_summary outputs data."""
+        """Test print_summary writes only to the given stream."""
+        buf = io.StringIO()
+        gbpusd_data.print_summary(file=buf)
+
+        assert capsys.readouterr().out == ""
+
+        captured = buf.getvalue()
+        assert "GBPUSD Market Data Summary" in captured
+        assert "FX Spot: 1.2750" in captured
+        assert "FX Forwards" in captured
+        assert "XCCY Basis Swaps" in captured
+
+    def test_print_summary_defaults_to_stdout(self, gbpusd_data: XCCYMarketData, capsys):
+        """Test print_summary writes to stdout when no file is given."""
         gbpusd_data.print_summary()
 
-        captured = capsys.readouterr()
-        assert "GBPUSD Market Data Summary" in captured.out
-        assert "FX Spot: 1.2750" in captured.out
-        assert "FX Forwards" in captured.out
-        assert "XCCY Basis Swaps" in captured.out
+        assert "GBPUSD Market Data Summary" in capsys.readouterr().out
 
 
 class TestMarketDataFactory:
     """Tests for MarketDataFactory."""
 
-    def test_create_gbpusd(self):
-        """Test creating GBPUSD data."""
-        data = MarketDataFactory.create_gbpusd()
-        assert data.ccy_pair == "GBPUSD"
-        assert data.fx_spot == 1.2750
-
-    def test_create_eurusd(self):
-        """Test creating EURUSD data."""
-        data = MarketDataFactory.create_eurusd()
-        assert data.ccy_pair == "EURUSD"
-        assert data.fx_spot == 1.0850
-        assert data.domestic_ccy.ccy == "USD"
-        assert data.foreign_ccy.ccy == "EUR"
-        assert data.foreign_ccy.ois_index_name == "ESTR"
-        assert data.fx_base_ccy == "EUR"  # Auto-detected as foreign
-        assert data.is_fx_base_domestic is False  # EUR is FX base, USD is collateral
-
-    def test_create_usdjpy(self):
-        """Test creating USDJPY data.
-
-        For USDJPY, USD is still the domestic (collateral) currency.
-        JPY is foreign. The FX base currency (USD) equals the collateral.
-        """
-        data = MarketDataFactory.create_usdjpy()
-        assert data.ccy_pair == "USDJPY"
-        assert data.fx_spot == 148.50
+    @pytest.fixture(
+        scope="module",
+        params=[
+            # (pair, ccy_pair, fx_spot, foreign, foreign index, fx base)
+            ("gbpusd", "GBPUSD", 1.2750, "GBP", "SONIA", "GBP"),
+            ("eurusd", "EURUSD", 1.0850, "EUR", "ESTR", "EUR"),
+            # USDJPY: USD is both the FX base and the collateral currency
+            ("usdjpy", "USDJPY", 148.50, "JPY", "TONAR", "USD"),
+        ],
+        ids=lambda param: param[1],
+    )
+    def pair_data(self, request) -> tuple:
+        """Create each pair's market data once, with its expected values."""
+        pair, *expected = request.param
+        return getattr(MarketDataFactory, f"create_{pair}")(), expected
+
+    def test_factory(self, pair_data: tuple):
+        """Test the factory output for each currency pair."""
+        data, (ccy_pair, fx_spot, foreign, foreign_index, fx_base) = pair_data
+        assert data.ccy_pair == ccy_pair
+        assert data.valuation_date == date(2024, 1, 15)
+        assert data.fx_spot == fx_spot
         assert data.domestic_ccy.ccy == "USD"
         assert data.domestic_ccy.ois_index_name == "SOFR"
-        assert data.foreign_ccy.ccy == "JPY"
-        assert data.foreign_ccy.ois_index_name == "TONAR"
-        assert data.fx_base_ccy == "USD"
-        assert data.is_fx_base_domestic is True  # USD is both FX base and collateral
+        assert data.foreign_ccy.ccy == foreign
+        assert data.foreign_ccy.ois_index_name == foreign_index
+        assert data.fx_base_ccy == fx_base
+        assert data.is_fx_base_domestic is (fx_base == "USD")
 
     def test_currency_configs_available(self):
         """Test that common currency configs are available."""
         expected_ccys = ["USD", "GBP", "EUR", "JPY", "CHF", "AUD", "CAD"]
         for ccy in expected_ccys:
-            assert ccy in MarketDataFactory.CURRENCY_CONFIGS
\ No newline at end of file
+            assert ccy in MarketDataFactory.CURRENCY_CONFIGS
+
+    def test_currency_configs_read_only(self):
+        """Test the shared currency configs cannot be replaced or added to."""
+        with pytest.raises(TypeError):
+            MarketDataFactory.CURRENCY_CONFIGS["USD"] = CurrencyConfig(
+                "USD", "SOFR", "US-GovtBond", "Actual360"
+            )